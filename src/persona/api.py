@@ -1,5 +1,7 @@
+import copy
 import pathlib as plb
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 import frontmatter
 
@@ -7,7 +9,7 @@ from persona.config import PersonaConfig
 from persona.storage import BaseFileStore, CursorLikeMetaStoreEngine, IndexEntry, Transaction
 from persona.embedder import FastEmbedder
 from persona.tagger import get_tagger
-from persona.templates import TemplateFile, Template
+from persona.templates import TemplateFile, Template, parse_frontmatter
 from persona.models import SkillFile
 
 # Moved back to mcp/utils/const.py or passed in as config if needed globally
@@ -15,20 +17,80 @@ from persona.models import SkillFile
 # but the instruction was to keep MCP specific stuff in MCP.
 # However, "install_skill" needs to know what files to write.
 # We will accept an optional whitelist in methods or use a sensible default.
-DEFAULT_EXT_WHITELIST = [
-    '.md',
-    '.txt',
-    '.json',
-    '.yaml',
-    '.yml',
-    '.cfg',
-    '.ini',
-    '.py',
-    '.js',
-    '.ts',
-    '.html',
-    '.css',
-]
+DEFAULT_EXT_WHITELIST: frozenset[str] = frozenset(
+    {
+        '.md',
+        '.txt',
+        '.json',
+        '.yaml',
+        '.yml',
+        '.cfg',
+        '.ini',
+        '.py',
+        '.js',
+        '.ts',
+        '.html',
+        '.css',
+    }
+)
+
+
+def _inject_skill_version(raw_content: bytes, version: str) -> bytes | None:
+    """Add `metadata.version` to the YAML frontmatter of a SKILL.md without parsing it.
+
+    Args:
+        raw_content (bytes): Raw content of the SKILL.md file.
+        version (str): Version to inject.
+
+    Returns:
+        bytes | None: The updated content, or None if the frontmatter is not plain YAML or already
+            defines a `metadata` key. Callers should then fall back to a full frontmatter parse.
+    """
+    if not raw_content.startswith(b'---\n'):
+        return None
+    end = raw_content.find(b'\n---\n', 3)
+    if end == -1:
+        return None
+    fm = raw_content[4:end]
+    if fm.startswith(b'metadata:') or b'\nmetadata:' in fm:
+        return None
+    injected = f"metadata:\n  version: '{version}'\n".encode('utf-8')
+    return raw_content[: end + 1] + injected + raw_content[end + 1 :]
+
+
+def _version_skill_md(raw_content: bytes, version: str) -> bytes:
+    """Set `metadata.version` in the frontmatter of a SKILL.md.
+
+    Args:
+        raw_content (bytes): Raw content of the SKILL.md file.
+        version (str): Version to inject.
+
+    Returns:
+        bytes: The SKILL.md content including the version.
+    """
+    versioned = _inject_skill_version(raw_content, version)
+    if versioned is not None:
+        return versioned
+
+    metadata, body, handler = parse_frontmatter(raw_content)
+
+    # NB: parsed metadata is shared with the parse cache, so build a new post from a deep copy
+    #  and keep the original handler so the frontmatter format round-trips
+    content = frontmatter.Post(body, handler=handler)
+    content.metadata.update(copy.deepcopy(dict(metadata)))
+    content.metadata['metadata'] = {'version': version}
+    return frontmatter.dumps(content).encode('utf-8')
+
+
+def _write_file(dest: plb.Path, content: bytes) -> None:
+    """Write bytes to a local file with raw os calls, skipping the buffered file object."""
+    fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 class PersonaAPI:
@@ -57,6 +119,10 @@ class PersonaAPI:
         self._meta_store = meta_store
         self._embedder = embedder
         self._library_skills = library_skills or {}
+        self._skill_md_cache: dict[tuple[str, str], bytes] = {}
+        # NB: resolve search defaults once instead of walking the config on every query
+        self._default_limit = config.meta_store.similarity_search.max_results
+        self._default_max_cosine_distance = config.meta_store.similarity_search.max_cosine_distance
 
     def _requires_embedder(self):
         if not self._embedder:
@@ -85,12 +151,14 @@ class PersonaAPI:
     ) -> list[dict]:
         """Search templates by query."""
         self._requires_embedder()
-        limit = limit or self.config.meta_store.similarity_search.max_results
+        limit = limit if limit is not None else self._default_limit
         max_cosine_distance = (
-            max_cosine_distance or self.config.meta_store.similarity_search.max_cosine_distance
+            max_cosine_distance
+            if max_cosine_distance is not None
+            else self._default_max_cosine_distance
         )
 
-        query_vector = cast(FastEmbedder, self._embedder).encode([query]).squeeze().tolist()
+        query_vector = cast(FastEmbedder, self._embedder).encode_query(query)
 
         with self._meta_store.read_session() as session:
             results = session.search(
@@ -123,76 +191,70 @@ class PersonaAPI:
             return {fn: obj.content for fn, obj in self._library_skills[name].items()}
 
         with self._meta_store.read_session() as session:
-            if not session.exists('skills', name):
-                raise ValueError(f"Skill '{name}' does not exist.")
-
-            skill_data = session.get_one('skills', name, ['files']).to_pylist()[0]
+            skill_data = session.get_record('skills', name, ['files'])
+        if skill_data is None:
+            raise ValueError(f"Skill '{name}' does not exist.")
 
         skill_files_paths = skill_data['files']
+        contents = cast(BaseFileStore, self._file_store).load_many(skill_files_paths)
 
-        results = {}
-        for storage_path in skill_files_paths:
-            filename = storage_path.rsplit('/', 1)[-1]
-            results[filename] = cast(BaseFileStore, self._file_store).load(storage_path)
-
-        return results
+        return {
+            storage_path.rsplit('/', 1)[-1]: contents[storage_path]
+            for storage_path in skill_files_paths
+        }
 
     def _skill_files(self, name: str) -> dict[str, SkillFile]:
         """Get a skill by name (logic)."""
         with self._meta_store.read_session() as session:
-            if session.exists('skills', name):
-                skill_files = cast(
-                    dict[str, str],
-                    session.get_one('skills', name, ['name', 'files', 'uuid']).to_pylist()[0],
-                )
-
-                # Load SKILL.md and inject version
-                # Note: This assumes SKILL.md is always present and in the list, which it should be.
-                skill_md_path = f'skills/{name}/SKILL.md'
-                raw_content = (
-                    cast(BaseFileStore, self._file_store).load(skill_md_path).decode('utf-8')
-                )
-                content = frontmatter.loads(raw_content)
-
-                # content.metadata might be None if empty
-                if content.metadata is None:
-                    content.metadata = {}
-
-                content.metadata['metadata'] = {'version': skill_files['uuid']}
-
-                results = {
-                    'SKILL.md': SkillFile(
-                        content=frontmatter.dumps(content).encode('utf-8'),
-                        name='SKILL.md',
-                        storage_file_path=skill_md_path,
-                        extension='.md',
-                    )
-                }
-
-                for target_store_file in skill_files['files']:
-                    # Logic from snippet:
-                    file = target_store_file.rsplit('/', 1)[-1]
-                    ext = os.path.splitext(file)[-1]
-
-                    # Use the whitelist defined in api.py or the imported constant
-                    # The snippet used EXT_WHITELIST. api.py has DEFAULT_EXT_WHITELIST.
-                    if ext not in DEFAULT_EXT_WHITELIST:
-                        continue
-                    elif file.endswith('SKILL.md'):
-                        continue
-                    else:
-                        _file_content = cast(BaseFileStore, self._file_store).load(
-                            target_store_file
-                        )
-                        results[file] = SkillFile(
-                            content=_file_content,
-                            name=file,
-                            storage_file_path=target_store_file,
-                            extension=ext,
-                        )
-                return results
+            skill_files = session.get_record('skills', name, ['name', 'files', 'uuid'])
+        if skill_files is None:
+            raise ValueError(f'Skill "{name}" not found')
+
+        # Note: This assumes SKILL.md is always present and in the list, which it should be.
+        skill_md_path = f'skills/{name}/SKILL.md'
+        to_fetch: dict[str, tuple[str, str]] = {}
+        for target_store_file in skill_files['files']:
+            file = target_store_file.rsplit('/', 1)[-1]
+            ext = os.path.splitext(file)[-1]
+
+            if ext not in DEFAULT_EXT_WHITELIST:
+                continue
+            elif file.endswith('SKILL.md'):
+                continue
             else:
-                raise ValueError(f'Skill "{name}" not found')
+                to_fetch[target_store_file] = (file, ext)
+
+        # NB: the versioned SKILL.md only changes with the skill's uuid, so it is
+        #  cached per (name, uuid) and only fetched (in the same batch as the other
+        #  files) on a miss
+        cache_key = (name, skill_files['uuid'])
+        skill_md_content = self._skill_md_cache.get(cache_key)
+        to_load = list(to_fetch)
+        if skill_md_content is None:
+            to_load.insert(0, skill_md_path)
+        contents = cast(BaseFileStore, self._file_store).load_many(to_load)
+
+        if skill_md_content is None:
+            skill_md_content = _version_skill_md(contents[skill_md_path], skill_files['uuid'])
+            self._skill_md_cache[cache_key] = skill_md_content
+
+        # NB: contents come straight from the file store as bytes, so skip validation
+        results = {
+            'SKILL.md': SkillFile.model_construct(
+                content=skill_md_content,
+                name='SKILL.md',
+                storage_file_path=skill_md_path,
+                extension='.md',
+            )
+        }
+        for target_store_file, (file, ext) in to_fetch.items():
+            results[file] = SkillFile.model_construct(
+                content=contents[target_store_file],
+                name=file,
+                storage_file_path=target_store_file,
+                extension=ext,
+            )
+        return results
 
     def install_skill(self, name: str, local_skill_dir: plb.Path) -> str:
         """Install a skill to a local directory."""
@@ -208,6 +270,7 @@ class PersonaAPI:
             skill_files = self._skill_files(name)
 
         skill_md_local_path: str | None = None
+        to_write: list[tuple[plb.Path, bytes]] = []
 
         for filename, file_obj in skill_files.items():
             # Standardize destination path
@@ -217,22 +280,28 @@ class PersonaAPI:
             # For library skills, we might need to handle storage_file_path differently if it doesn't start with skills/
             # But let's assume storage_file_path is always set correctly or we use a fallback.
 
-            rel_path = file_obj.storage_file_path.replace('skills/', '')
-            # Remove leading slash if present after replace (though usually it won't be if it was 'skills/...')
-            if rel_path.startswith('/'):
-                rel_path = rel_path[1:]
+            # NB: only strip the leading store prefix; library skills are stored without it
+            rel_path = file_obj.storage_file_path.removeprefix('skills/').lstrip('/')
 
             dest = local_skill_dir / rel_path
-
-            if not dest.parent.exists():
-                dest.parent.mkdir(parents=True, exist_ok=True)
-
-            with dest.open('wb') as f:
-                f.write(file_obj.content)
+            to_write.append((dest, file_obj.content))
 
             if filename == 'SKILL.md':
                 skill_md_local_path = str(dest)
 
+        # NB: many files share a parent, so create each unique directory once
+        for parent in {dest.parent for dest, _ in to_write}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        # NB: directories are created serially above, the writes themselves are independent
+        #  so larger skills overlap them in a thread pool (file I/O releases the GIL)
+        if len(to_write) < 4:
+            for dest, content in to_write:
+                _write_file(dest, content)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(to_write))) as executor:
+                list(executor.map(lambda item: _write_file(*item), to_write))
+
         if not skill_md_local_path:
             raise ValueError(f"SKILL.md not found for skill '{name}'.")
 
@@ -285,7 +354,7 @@ class PersonaAPI:
         """Get the version (UUID) of a skill."""
         with self._meta_store.open(bootstrap=False):
             with self._meta_store.read_session() as session:
-                if not session.exists('skills', name):
-                    raise ValueError(f"Skill '{name}' not found.")
-                result = session.get_one('skills', name, ['uuid']).to_pylist()[0]
-                return result['uuid']
+                result = session.get_record('skills', name, ['uuid'])
+            if result is None:
+                raise ValueError(f"Skill '{name}' not found.")
+            return result['uuid']
@@ -16,7 +16,7 @@ from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
 from fsspec.implementations.local import LocalFileSystem
 from fsspec.asyn import AsyncFileSystem
 
-from persona.config import parse_persona_config, PersonaConfig
+from persona.config import parse_persona_config, read_config_file, PersonaConfig
 
 logger = logging.getLogger('persona')
 handler = logging.StreamHandler()
@@ -150,11 +150,10 @@ def main(
         if not config.exists():
             config_parsed = parse_persona_config(overrides)
         else:
-            with config.open('r') as f:
-                config_raw = cast(dict, yaml.safe_load(f) or {})
-                # NB: validate the raw config if it exists
-                # This also adds default values for optional fields
-                config_validated = PersonaConfig.model_validate(config_raw).model_dump()
+            config_raw = read_config_file(config)
+            # NB: validate the raw config if it exists
+            # This also adds default values for optional fields
+            config_validated = PersonaConfig.model_validate(config_raw).model_dump()
             config_updated = deep_update(config_validated, overrides)
             config_parsed = parse_persona_config(config_updated)
     except Exception:
@@ -174,17 +173,26 @@ def main(
 @app.command(help='Re-index personas and skills.')
 def reindex(ctx: typer.Context):
     """Re-index personas and skills."""
-    from persona.cli.utils import _template_producer, _embedding_consumer
+    from persona.cli.utils import _template_producer, _embedding_consumer, _get_known_embeddings
     from persona.storage import get_file_store_backend, get_meta_store_backend
     from persona.embedder import get_embedding_model
     from persona.tagger import get_tagger
 
     _config: PersonaConfig = ctx.obj['config']
     target_file_store = get_file_store_backend(_config.file_store)
-    meta_store = get_meta_store_backend(_config.meta_store, read_only=False)
     embedder = get_embedding_model()
+    meta_store = get_meta_store_backend(
+        _config.meta_store, read_only=False, embedding_model=embedder.model_id
+    )
     tagger = get_tagger(embedder)
     _path = _config.root
+    # NB: descriptions that did not change keep their embedding from the current index, as long
+    #  as it was built with the same embedding model
+    known_embeddings = _get_known_embeddings(
+        get_meta_store_backend(_config.meta_store, read_only=True),
+        ['roles', 'skills'],
+        embedding_model=embedder.model_id,
+    )
 
     async def run_pipeline():
         # NB: reindexing would gain from async ffspec interface, so we re-init it
@@ -202,7 +210,13 @@ def reindex(ctx: typer.Context):
         producer_task = asyncio.create_task(_template_producer(afs, _path, queue))
         consumer_task = asyncio.create_task(
             _embedding_consumer(
-                afs, queue, embedder, tagger, batch_size=32, index_keys=['roles', 'skills']
+                afs,
+                queue,
+                embedder,
+                tagger,
+                batch_size=32,
+                index_keys=['roles', 'skills'],
+                known_embeddings=known_embeddings,
             )
         )
         await asyncio.gather(producer_task)
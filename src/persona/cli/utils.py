@@ -11,11 +11,12 @@ from typing import cast
 
 import typer
 import orjson
+import numpy as np
 from rich.console import Console
 import frontmatter
 from fsspec.asyn import AsyncFileSystem
 
-from persona.storage import IndexEntry
+from persona.storage import IndexEntry, CursorLikeMetaStoreEngine
 from persona.embedder import FastEmbedder
 from persona.tagger import TagExtractor
 from persona.cache import download_and_cache_github_repo
@@ -277,6 +278,7 @@ async def _embedding_consumer(
     tagger: TagExtractor,
     index_keys: list[str],
     batch_size: int = 32,
+    known_embeddings: dict[str, np.ndarray] | None = None,
 ) -> dict[str, list[dict]]:
     """Consume template frontmatter and embed them in batches of size 32
 
@@ -284,6 +286,8 @@ async def _embedding_consumer(
         queue (asyncio.Queue): Queue to get processed templates from
         embedder (FastEmbedder): Embedder to encode descriptions
         batch_size (int, optional): Batch size for embedding. Defaults to 32.
+        known_embeddings (dict[str, np.ndarray] | None, optional): Embeddings from the existing
+            index keyed by description. Descriptions found here are not embedded again. Defaults to None.
 
     Returns:
         dict[str, list[dict]]: Dictionary with keys 'skills' and 'roles' containing lists of embedded templates.
@@ -296,11 +300,17 @@ async def _embedding_consumer(
             return
         descriptions = [cast(str, entry.description) for entry in current_batch]
         ids = cast(list[str], [entry.name for entry in current_batch])
-        embeddings = await asyncio.to_thread(embedder.encode, descriptions)
+        known = known_embeddings or {}
+        embeddings: list[np.ndarray | None] = [known.get(d) for d in descriptions]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            encoded = await asyncio.to_thread(embedder.encode, [descriptions[i] for i in missing])
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
         # NB: it's simpler to just extract it for the whole batch
         tags = await asyncio.to_thread(tagger.extract_tags, ids, descriptions)
         for item, embedding in zip(current_batch, embeddings):
-            item.update('embedding', embedding.tolist())
+            item.update('embedding', cast(np.ndarray, embedding).tolist())
             item_name = cast(str, item.name)
             if tags.get(item_name) is not None:
                 if item.tags == [] and tags[item_name] != []:
@@ -334,3 +344,51 @@ async def _embedding_consumer(
 
         queue.task_done()
     return index
+
+
+def _get_known_embeddings(
+    meta_store: CursorLikeMetaStoreEngine, index_keys: list[str], embedding_model: str
+) -> dict[str, np.ndarray]:
+    """Read the embeddings stored in the existing index, keyed by template description
+
+    Tables whose embeddings were produced by another model than `embedding_model` are skipped.
+
+    Args:
+        meta_store (CursorLikeMetaStoreEngine): Read-only metastore engine holding the current index
+        index_keys (list[str]): Tables to read embeddings from
+        embedding_model (str): Identifier of the current embedding model
+
+    Returns:
+        dict[str, np.ndarray]: Mapping of description to its stored embedding
+    """
+    known: dict[str, np.ndarray] = {}
+    try:
+        with meta_store.open(bootstrap=True) as connected:
+            with connected.read_session() as session:
+                for key in index_keys:
+                    if connected.stored_embedding_model(key) != embedding_model:
+                        logger.debug(f'Stored {key} embeddings come from another model; skipping')
+                        continue
+                    # NB: the embeddings are the bulk of the index, so they are read batch by batch
+                    #  and kept in one float32 array per batch; the mapping only holds row views
+                    for batch in session.get_many_batches(
+                        key, column_filter=['description', 'embedding']
+                    ):
+                        embeddings = batch.column('embedding')
+                        width = embeddings.type.list_size
+                        vectors = (
+                            embeddings.values.slice(
+                                embeddings.offset * width, len(embeddings) * width
+                            )
+                            .to_numpy(zero_copy_only=False)
+                            .reshape(len(embeddings), width)
+                        )
+                        valid = embeddings.is_valid().to_numpy(zero_copy_only=False)
+                        for row, description in enumerate(batch.column('description').to_pylist()):
+                            if description is not None and valid[row]:
+                                known[description] = vectors[row]
+    except Exception as e:
+        # NB: an unreadable or outdated index is exactly what reindexing fixes, so embed everything
+        logger.debug(f'Could not read embeddings from existing index: {e}')
+        return {}
+    return known
@@ -2,11 +2,18 @@ import pathlib as plb
 from typing import Literal, Union
 from typing_extensions import Annotated
 import copy
+import yaml
 from platformdirs import user_data_dir
 
 from pydantic import Field, model_validator, BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    # NB: libyaml-backed loader is several times faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 class ConfigWithRoot(BaseModel):
     """Settings shared by a root folder."""
@@ -160,3 +167,16 @@ def parse_persona_config(data: dict) -> PersonaConfig:
         data_['meta_store']['type'] = 'duckdb'
 
     return PersonaConfig(**data_)
+
+
+def read_config_file(path: plb.Path) -> dict:
+    """Read a raw (unvalidated) persona configuration from a YAML file.
+
+    Args:
+        path (plb.Path): Path to the configuration file.
+
+    Returns:
+        dict: The raw configuration, or an empty dictionary if the file is empty.
+    """
+    with path.open('r') as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
@@ -1,4 +1,6 @@
 import os
+import functools
+import hashlib
 from typing import cast
 import pathlib as plb
 import tempfile
@@ -20,6 +22,22 @@ options.log_severity_level = 3
 logger = logging.getLogger('persona.embedder')
 
 
+def _get_execution_providers() -> list[str]:
+    """Get the ONNX runtime execution providers for the embedding model.
+
+    The CUDA provider is opt-in through `PERSONA_USE_CUDA=1` so the default path stays on the CPU.
+    If CUDA is requested but not available in the installed onnxruntime build, we fall back to the CPU.
+
+    Returns:
+        list[str]: Execution providers in order of preference.
+    """
+    if os.environ.get('PERSONA_USE_CUDA', '0') == '1':
+        if 'CUDAExecutionProvider' in ort.get_available_providers():
+            return ['CUDAExecutionProvider', 'CPUExecutionProvider']
+        logger.warning('PERSONA_USE_CUDA is set but CUDA is not available. Falling back to CPU.')
+    return ['CPUExecutionProvider']
+
+
 def get_embedding_model(
     model_dir: str | plb.Path | None = None, model_name: str = 'model.onnx'
 ) -> 'FastEmbedder':
@@ -53,7 +71,14 @@ def get_embedding_model(
         downloader = EmbeddingDownloader()
         downloader.download()
 
-    return FastEmbedder(model_dir=str(model_dir), model_name=model_name)
+    return _load_embedder(str(model_dir), model_name)
+
+
+@functools.cache
+def _load_embedder(model_dir: str, model_name: str) -> 'FastEmbedder':
+    # NB: loading the ONNX session is the expensive part of startup, so one instance is shared
+    #  per model file for the lifetime of the process
+    return FastEmbedder(model_dir=model_dir, model_name=model_name)
 
 
 class EmbeddingDownloader:
@@ -108,25 +133,66 @@ class FastEmbedder:
             model_dir (str | plb.Path): Directory in which the downloaded model is stored.
             model_name (str, optional): Name of the model file. Defaults to 'model.onnx'.
         """
+        self._model_dir = Path(model_dir)
         self.tokenizer: Tokenizer = Tokenizer.from_file(str(Path(model_dir) / 'tokenizer.json'))
         self.tokenizer.enable_padding(pad_id=0, pad_token='[PAD]')
         self.tokenizer.enable_truncation(max_length=512)
 
         self.session = ort.InferenceSession(
             str(Path(model_dir) / model_name),
-            providers=['CPUExecutionProvider'],
+            providers=_get_execution_providers(),
             sess_options=options,
         )
+        # NB: cache lives on the instance so it is dropped together with the model
+        self._encode_query_cached = functools.lru_cache(maxsize=1024)(self._encode_query)
+
+    @functools.cached_property
+    def model_id(self) -> str:
+        """Fingerprint of the model files, used to tell whether stored embeddings came from this model.
 
-    def encode(self, text: list[str]) -> np.ndarray[tuple[int, int], np.dtype[np.float32]]:
+        Returns:
+            str: BLAKE2b digest over the names and contents of the files in the model directory.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for file in sorted(self._model_dir.iterdir()):
+            if not file.is_file():
+                continue
+            hasher.update(file.name.encode())
+            with file.open('rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
+
+    def encode(
+        self, text: list[str], batch_size: int = 32
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.float32]]:
         """Retrieve the embedding for a text query.
 
+        Large inputs are sorted by length and embedded in mini-batches, so each batch is only
+        padded to its own longest text instead of the longest text overall.
+
         Args:
             text (list[str]): Input texts to be embedded.
+            batch_size (int, optional): Maximum number of texts per forward pass. Defaults to 32.
 
         Returns:
             np.ndarray: Array containing the embedding for the input text.
         """
+        if len(text) <= batch_size:
+            return self._encode_batch(text)
+        order = np.argsort([-len(t) for t in text], kind='stable')
+        sorted_text = [text[i] for i in order]
+        sorted_embeddings = np.vstack(
+            [
+                self._encode_batch(sorted_text[i : i + batch_size])
+                for i in range(0, len(sorted_text), batch_size)
+            ]
+        )
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+    def _encode_batch(self, text: list[str]) -> np.ndarray[tuple[int, int], np.dtype[np.float32]]:
         input_ids = []
         attention_mask = []
         for e in self.tokenizer.encode_batch(text):
@@ -141,3 +207,22 @@ class FastEmbedder:
         outputs = cast(list[np.ndarray], self.session.run(None, inputs))
 
         return outputs[0]
+
+    def _encode_query(self, text: str) -> np.ndarray[tuple[int], np.dtype[np.float32]]:
+        embedding = np.ascontiguousarray(self.encode([text])[0], dtype=np.float32)
+        # NB: the cached array is shared between callers, so it must not be modified in place
+        embedding.flags.writeable = False
+        return embedding
+
+    def encode_query(self, text: str) -> np.ndarray[tuple[int], np.dtype[np.float32]]:
+        """Retrieve the embedding for a single search query.
+
+        Results are cached on the embedder instance, so repeated queries skip the forward pass.
+
+        Args:
+            text (str): Query text to be embedded.
+
+        Returns:
+            np.ndarray: Read-only float32 embedding for the query.
+        """
+        return self._encode_query_cached(text)
@@ -18,6 +18,7 @@ class AppContext(BaseModel):
     _meta_store_engine: CursorLikeMetaStoreEngine = PrivateAttr()
     _embedding_model: FastEmbedder = PrivateAttr()
     _api: 'PersonaAPI' = PrivateAttr()
+    _prompts: dict[str, str] = PrivateAttr(default_factory=dict)
 
     model_config = {'arbitrary_types_allowed': True}
 
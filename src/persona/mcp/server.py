@@ -4,23 +4,22 @@ from typing import Annotated
 import pathlib as plb
 import logging
 
-import aiofiles
 from httpx import AsyncClient
 from fastmcp import FastMCP, Context
 from fastmcp.utilities.logging import configure_logging
 from pydantic import Field
 
 from persona.models import TemplateMatch
+from persona.templates import parse_frontmatter
 from .models import TemplateDetails
 from .utils import (
     lifespan,
     get_api,
+    get_prompt,
 )
 
 http_client = AsyncClient(timeout=30.0)
 
-prompts_dir = plb.Path(__file__).parent / 'prompts'
-
 configure_logging(level='DEBUG')
 
 persona_logger = logging.getLogger('persona')
@@ -125,13 +124,11 @@ def get_role(
     """Get a role by name."""
     api = get_api(ctx)
     raw_content = api.get_definition(name, 'roles')
-    import frontmatter
-
-    post = frontmatter.loads(raw_content.decode('utf-8'))
+    metadata, prompt, _ = parse_frontmatter(raw_content)
     return TemplateDetails(
         name=name,
-        description=str(post.metadata.get('description', '')),
-        prompt=post.content.strip(),
+        description=str(metadata.get('description', '')),
+        prompt=prompt.strip(),
     )
 
 
@@ -237,9 +234,8 @@ async def get_instructions() -> str:
 @mcp.prompt(
     name='persona:roles:roleplay', description='Assume a role based on the provided description.'
 )
-async def persona_roleplay(description: str) -> str:
-    async with aiofiles.open(prompts_dir / 'roleplay.md', mode='r') as f:
-        template = (await f.read()).strip()
+def persona_roleplay(ctx: Context, description: str) -> str:
+    template = get_prompt(ctx, 'roleplay')
     user_instructions = f"""
     ## User input
 
@@ -252,9 +248,8 @@ async def persona_roleplay(description: str) -> str:
     name='persona:roles:template',
     description='Prompt engineering template for creating a new role.',
 )
-async def persona_template(description: str) -> str:
-    async with aiofiles.open(prompts_dir / 'template.md', mode='r') as f:
-        template = (await f.read()).strip()
+def persona_template(ctx: Context, description: str) -> str:
+    template = get_prompt(ctx, 'template')
     user_instructions = f"""
     ## User input
 
@@ -267,9 +262,8 @@ async def persona_template(description: str) -> str:
     name='persona:roles:review',
     description='Review a role definition for quality and completeness.',
 )
-async def persona_review(role: str, chat_history: str | None = None) -> str:
-    async with aiofiles.open(prompts_dir / 'review.md', mode='r') as f:
-        template = (await f.read()).strip()
+def persona_review(ctx: Context, role: str, chat_history: str | None = None) -> str:
+    template = get_prompt(ctx, 'review')
     user_instructions = f"""
     ## User input
 
@@ -283,9 +277,8 @@ async def persona_review(role: str, chat_history: str | None = None) -> str:
 
 
 @mcp.prompt(name='persona:roles:edit', description='Edit a role definition based on feedback.')
-async def persona_edit(role: str, feedback: str) -> str:
-    async with aiofiles.open(prompts_dir / 'edit.md', mode='r') as f:
-        template = (await f.read()).strip()
+def persona_edit(ctx: Context, role: str, feedback: str) -> str:
+    template = get_prompt(ctx, 'edit')
     user_instructions = f"""
     ## User input
 
@@ -302,9 +295,8 @@ async def persona_edit(role: str, feedback: str) -> str:
     name='persona:skills:deploy',
     description='Execute a prompt with explicit skill deployment instructions.',
 )
-async def skill_deploy(task: str) -> str:
-    async with aiofiles.open(prompts_dir / 'skill_deploy.md', mode='r') as f:
-        template = (await f.read()).strip()
+def skill_deploy(ctx: Context, task: str) -> str:
+    template = get_prompt(ctx, 'skill_deploy')
     user_instructions = f"""
     ## User input
 
@@ -317,11 +309,11 @@ async def skill_deploy(task: str) -> str:
     name='persona:skills:update',
     description='Update a specific skill if a new version is available.',
 )
-async def skill_update(
+def skill_update(
+    ctx: Context,
     name: Annotated[str, Field(description='Name of the skill to update.')],
 ) -> str:
-    async with aiofiles.open(prompts_dir / 'skill_update.md', mode='r') as f:
-        template = (await f.read()).strip()
+    template = get_prompt(ctx, 'skill_update')
     user_instructions = f"""
     ## User input
 
@@ -5,4 +5,5 @@ from .lifespan import (
     get_file_store as get_file_store,
     get_embedder as get_embedder,
     get_config as get_config,
+    get_prompt as get_prompt,
 )
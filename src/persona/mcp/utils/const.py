@@ -1,14 +1,16 @@
-EXT_WHITELIST = [
-    '.md',
-    '.txt',
-    '.json',
-    '.yaml',
-    '.yml',
-    '.cfg',
-    '.ini',
-    '.py',
-    '.js',
-    '.ts',
-    '.html',
-    '.css',
-]
+EXT_WHITELIST: frozenset[str] = frozenset(
+    {
+        '.md',
+        '.txt',
+        '.json',
+        '.yaml',
+        '.yml',
+        '.cfg',
+        '.ini',
+        '.py',
+        '.js',
+        '.ts',
+        '.html',
+        '.css',
+    }
+)
@@ -1,31 +1,54 @@
+import os
 import pathlib as plb
 import logging
 from collections import defaultdict
+from functools import cache
 
 from persona.models import SkillFile
 
 logger = logging.getLogger('persona.mcp.utils.lib')
 
 library_skills_path = plb.Path(__file__).parent.parent / 'assets' / 'skills'
+prompts_path = plb.Path(__file__).parent.parent / 'prompts'
 
 
 def _get_builtin_skills() -> dict[str, dict[str, SkillFile]]:
     """Get all skills that are part of this MCP library."""
+    root = str(library_skills_path)
     skills: dict[str, dict[str, SkillFile]] = defaultdict(dict)
-    for skill_path in library_skills_path.glob('*/SKILL.md'):
-        skill_name = skill_path.parent.name
-        for fn in skill_path.parent.glob('**/*'):
-            if fn.is_dir():
-                continue
-            ext = fn.suffix
-            name = fn.name
-            skills[skill_name][name] = SkillFile(
-                content=fn.read_bytes(),
+    skill_names: set[str] = set()
+    # NB: a single os.walk pass (scandir based) instead of one recursive glob per skill
+    for dirpath, _, filenames in os.walk(root):
+        rel_dir = dirpath[len(root) + 1 :]
+        if not rel_dir:
+            continue
+        skill_name = rel_dir.split(os.sep, 1)[0]
+        if rel_dir == skill_name and 'SKILL.md' in filenames:
+            skill_names.add(skill_name)
+        for name in filenames:
+            with open(os.path.join(dirpath, name), 'rb') as f:
+                content = f.read()
+            # NB: inputs come from our own package assets, so skip pydantic validation
+            skills[skill_name][name] = SkillFile.model_construct(
+                content=content,
                 name=name,
-                storage_file_path=str(fn.relative_to(library_skills_path)),
-                extension=ext,
+                storage_file_path=os.path.join(rel_dir, name),
+                extension=os.path.splitext(name)[1],
             )
-    return skills
+    # Only directories with a top-level SKILL.md are skills
+    return {name: files for name, files in skills.items() if name in skill_names}
 
 
-library_skills = _get_builtin_skills()
+def _get_prompts() -> dict[str, str]:
+    """Get all prompt templates that are part of this MCP library, keyed by file stem."""
+    return {fn.stem: fn.read_text().strip() for fn in prompts_path.glob('*.md')}
+
+
+@cache
+def get_library_skills() -> dict[str, dict[str, SkillFile]]:
+    """Get the builtin skills, reading them from disk on first use only.
+
+    Deferring the read keeps importing this module free of filesystem access, e.g. for CLI
+    commands that never touch skills.
+    """
+    return _get_builtin_skills()
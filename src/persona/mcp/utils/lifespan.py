@@ -4,11 +4,10 @@ from contextlib import asynccontextmanager, contextmanager
 from typing import Generator, cast
 from typing import AsyncIterator
 
-import yaml
 from fastmcp import FastMCP, Context
 from mcp.shared.context import RequestContext
 
-from persona.config import parse_persona_config, PersonaConfig
+from persona.config import parse_persona_config, read_config_file, PersonaConfig
 from persona.storage import (
     get_file_store_backend,
     get_meta_store_backend,
@@ -18,7 +17,7 @@ from persona.storage import (
 from persona.embedder import get_embedding_model, FastEmbedder
 from persona.mcp.models import AppContext
 from persona.api import PersonaAPI
-from .lib import library_skills
+from .lib import get_library_skills, _get_prompts
 
 
 @asynccontextmanager
@@ -33,8 +32,7 @@ async def lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         else plb.Path(os.environ['PERSONA_CONFIG_PATH'])
     )
     if persona_config_path.exists():
-        with persona_config_path.open('r') as f:
-            config_raw = yaml.safe_load(f) or {}
+        config_raw = read_config_file(persona_config_path)
         config_validated = PersonaConfig.model_validate(config_raw).model_dump()
         config = parse_persona_config(config_validated)
     else:
@@ -45,11 +43,16 @@ async def lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         get_meta_store_backend(config.meta_store, read_only=True).connect().bootstrap()
     )
     embedding_model = get_embedding_model()
+    # NB: the first inference run allocates the ONNX runtime memory arena and finalizes the graph,
+    #  warm the model up here so the first search request does not pay for it
+    embedding_model.encode(['warmup'])
 
     app_context = AppContext(config=config)
     app_context._file_store = file_store
     app_context._meta_store_engine = meta_store_engine
     app_context._embedding_model = embedding_model
+    # NB: prompt templates are static, so read them once instead of on every prompt request
+    app_context._prompts = _get_prompts()
 
     # Initialize API once for the lifetime of the server
     app_context._api = PersonaAPI(
@@ -57,36 +60,39 @@ async def lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         file_store=file_store,
         meta_store=meta_store_engine,
         embedder=embedding_model,
-        library_skills=library_skills,
+        library_skills=get_library_skills(),
     )
 
     yield app_context
     meta_store_engine.close()
 
 
+def _app(ctx: Context) -> AppContext:
+    """Get the application context that the lifespan attached to the request."""
+    return cast(RequestContext, ctx.request_context).lifespan_context
+
+
 @contextmanager
 def get_meta_store_session(ctx: Context) -> Generator[BaseMetaStoreSession, None, None]:
-    app_context: AppContext = cast(RequestContext, ctx.request_context).lifespan_context
-    meta_store = app_context._meta_store_engine
-    with meta_store.read_session() as session:
+    with _app(ctx)._meta_store_engine.read_session() as session:
         yield session
 
 
 def get_api(ctx: Context) -> PersonaAPI:
-    app_context: AppContext = cast(RequestContext, ctx.request_context).lifespan_context
-    return app_context._api
+    return _app(ctx)._api
 
 
 def get_file_store(ctx: Context) -> BaseFileStore:
-    app_context: AppContext = cast(RequestContext, ctx.request_context).lifespan_context
-    return app_context._file_store
+    return _app(ctx)._file_store
 
 
 def get_embedder(ctx: Context) -> FastEmbedder:
-    app_context: AppContext = cast(RequestContext, ctx.request_context).lifespan_context
-    return app_context._embedding_model
+    return _app(ctx)._embedding_model
 
 
 def get_config(ctx: Context) -> PersonaConfig:
-    app_context: AppContext = cast(RequestContext, ctx.request_context).lifespan_context
-    return app_context.config
+    return _app(ctx).config
+
+
+def get_prompt(ctx: Context, name: str) -> str:
+    return _app(ctx)._prompts[name]
@@ -1,4 +1,8 @@
+import fnmatch
 import logging
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generic, TypeVar, cast, BinaryIO, TYPE_CHECKING
 from abc import ABCMeta, abstractmethod
 
@@ -22,33 +26,75 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
         self._logger.debug(f'Storage backend filesystem initialized: {self._fs}')
 
         self._transaction: Transaction | None = None
+        # NB: the root does not change after initialization, so it is normalized once
+        self._root = self._normalize_root(self.config.root.rstrip('/')) if self.config.root else ''
+        self._root_prefix = f'{self._root}/'
+        # NB: parent directories this store already created, so repeated saves skip `makedirs`
+        self._known_dirs: set[str] = set()
 
     @abstractmethod
     def initialize(self) -> AbstractFileSystem:
         """Initialize the storage backend and return the filesystem object."""
         pass
 
+    def _normalize_root(self, root: str) -> str:
+        """Normalize the configured root path for use in `join_path`."""
+        return root
+
     def join_path(self, key: str) -> str:
         """Join root path with a key
 
+        Keys that already start with the root path (e.g. paths returned by `glob`) are returned as-is.
+
         Args:
             key (str): relative path to the file, e.g. path/to/file.txt
 
         Returns:
             str: joined path, e.g. /home/vscode/workspace/path/to/file.txt
         """
-        if not self.config.root:
+        if not self._root:
             raise ValueError('Root path is not set.')
-        return f'{self.config.root.rstrip("/")}/{key}'
+        if key.startswith(self._root_prefix):
+            return key
+        return f'{self._root_prefix}{key}'
 
     def _save(self, key: str, data: bytes) -> None:
         """Save data to the storage backend without transaction logging."""
         fp = self.join_path(key)
         self._logger.debug(f'Saving data to path: {fp}')
-        self._fs.makedirs(self._fs._parent(fp), exist_ok=True)
+        parent = self._fs._parent(fp)
+        self._ensure_dir(parent)
+        try:
+            self._write(fp, data)
+        except FileNotFoundError:
+            # NB: the directory was removed outside of this store; create it again
+            self._known_dirs.discard(parent)
+            self._ensure_dir(parent)
+            self._write(fp, data)
+
+    def _write(self, fp: str, data: bytes) -> None:
+        """Write data to a full path on the filesystem."""
         with cast(BinaryIO, self._fs.open(fp, 'wb')) as f:
             f.write(data)
 
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory unless this store already created it."""
+        if path not in self._known_dirs:
+            self._fs.makedirs(path, exist_ok=True)
+            self._known_dirs.add(path)
+
+    def _save_many(self, items: dict[str, bytes]) -> None:
+        """Save several keys to the storage backend without transaction logging.
+
+        Each parent directory is created once, and the writes go through the fsspec bulk
+        `pipe` API, which runs them concurrently on async backends.
+        """
+        paths = {self.join_path(key): data for key, data in items.items()}
+        self._logger.debug(f'Saving data to {len(paths)} paths')
+        for parent in {self._fs._parent(fp) for fp in paths}:
+            self._ensure_dir(parent)
+        self._fs.pipe(paths)
+
     def save(self, key: str, data: bytes) -> None:
         """
         Save data to the storage backend.
@@ -58,11 +104,15 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
             data: The string data to be saved.
         """
         if self._transaction:
-            if self.exists(key):
-                existing_data = self.load(key)
-                self._transaction._add_log_entry('restore', key, existing_data)
-            else:
-                self._transaction._add_log_entry('delete', key)
+            # NB: a key written earlier in the transaction already has its original state logged
+            if not self._transaction._has_log_entry(key):
+                # NB: a single read tells us both whether the key exists and what to restore
+                try:
+                    existing_data = self.load(key)
+                except FileNotFoundError:
+                    self._transaction._add_log_entry('delete', key)
+                else:
+                    self._transaction._add_log_entry('restore', key, existing_data)
             # Keep track of new file hashes for idempotent transaction id
             self._transaction._add_file_hash(key, data)
         self._save(key, data)
@@ -70,8 +120,19 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
     def _delete(self, key: str, recursive: bool) -> None:
         """Delete data from the storage backend without transaction logging."""
         self._logger.debug(f'Deleting data with key: {key}')
-        if self.exists(key):
+        try:
             self._fs.rm(self.join_path(key), recursive=recursive)
+        except FileNotFoundError:
+            return
+        if recursive:
+            self._known_dirs.clear()
+
+    def _delete_many(self, keys: list[str]) -> None:
+        """Delete several files from the storage backend in one call without transaction logging."""
+        self._logger.debug(f'Deleting data with keys: {keys}')
+        paths = [fp for fp in map(self.join_path, keys) if self._fs.exists(fp)]
+        if paths:
+            self._fs.rm(paths)
 
     def delete(self, key: str, recursive: bool = False) -> None:
         """
@@ -80,12 +141,12 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
         Args:
             key: The identifier for the data to be deleted.
         """
-        if self._transaction:
-            if self.exists(key):
-                if not self._fs.isdir(self.join_path(key)):
-                    existing_data = self.load(key)
-                    self._transaction._add_log_entry('restore', key, existing_data)
-                    self._transaction._add_file_hash(key, existing_data)
+        if self._transaction and not self._transaction._has_log_entry(key):
+            exists, is_dir = self._stat(key)
+            if exists and not is_dir:
+                existing_data = self.load(key)
+                self._transaction._add_log_entry('restore', key, existing_data)
+                self._transaction._add_file_hash(key, existing_data)
         self._delete(key, recursive=recursive)
 
     def load(self, key: str) -> bytes:
@@ -103,6 +164,25 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
         with cast(BinaryIO, self._fs.open(fp, 'rb')) as f:
             return f.read()
 
+    def load_many(self, keys: list[str]) -> dict[str, bytes]:
+        """
+        Load multiple keys from the storage backend in one call.
+
+        Loads are issued concurrently from a small thread pool, so fetching the files of
+        a template costs roughly one round-trip instead of one per file. Backends with a
+        native bulk read API can override this method.
+
+        Args:
+            keys: The identifiers for the data.
+
+        Returns:
+            A mapping of key to the loaded data.
+        """
+        if len(keys) <= 1:
+            return {key: self.load(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(8, len(keys))) as executor:
+            return dict(zip(keys, executor.map(self.load, keys)))
+
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in the storage backend.
@@ -116,6 +196,21 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
         self._logger.debug(f'Checking for existence of key: {key}')
         return self._fs.exists(self.join_path(key))
 
+    def _stat(self, key: str) -> tuple[bool, bool]:
+        """Check whether a key exists and whether it is a directory with a single lookup.
+
+        Args:
+            key: The identifier for the data.
+
+        Returns:
+            A tuple of (exists, is_dir).
+        """
+        try:
+            info = self._fs.info(self.join_path(key))
+        except FileNotFoundError:
+            return False, False
+        return True, info['type'] == 'directory'
+
     def is_dir(self, key: str) -> bool:
         """
         Check if a key is a directory in the storage backend.
@@ -144,3 +239,60 @@ class BaseFileStore(Generic[T], metaclass=ABCMeta):
 class LocalFileStore(BaseFileStore[LocalFileStoreConfig]):
     def initialize(self) -> LocalFileSystem:
         return LocalFileSystem()
+
+    def _normalize_root(self, root: str) -> str:
+        # NB: resolve the root the way fsspec would (protocol, '~', relative paths) once, so
+        #  joined paths can be passed to `os` functions directly
+        return cast(str, self._fs._strip_protocol(root))
+
+    # NB: the methods below bypass fsspec's per-call path normalization and call `os` directly
+
+    def _write(self, fp: str, data: bytes) -> None:
+        with open(fp, 'wb') as f:
+            f.write(data)
+
+    def _save_many(self, items: dict[str, bytes]) -> None:
+        paths = {self.join_path(key): data for key, data in items.items()}
+        self._logger.debug(f'Saving data to {len(paths)} paths')
+        for parent in {self._fs._parent(fp) for fp in paths}:
+            self._ensure_dir(parent)
+        # NB: fsspec's `pipe` writes local files one by one. File writes release the GIL, so
+        #  larger batches are written from a thread pool instead.
+        if len(paths) < 4:
+            for fp, data in paths.items():
+                self._write(fp, data)
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            list(executor.map(self._write, paths.keys(), paths.values()))
+
+    def load(self, key: str) -> bytes:
+        fp = self.join_path(key)
+        self._logger.debug(f'Loading data from path: {fp}')
+        with open(fp, 'rb') as f:
+            return f.read()
+
+    def _stat(self, key: str) -> tuple[bool, bool]:
+        try:
+            st = os.stat(self.join_path(key))
+        except FileNotFoundError:
+            return False, False
+        return True, stat.S_ISDIR(st.st_mode)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.join_path(key))
+
+    def is_dir(self, key: str) -> bool:
+        return os.path.isdir(self.join_path(key))
+
+    def glob(self, pattern: str) -> list[str]:
+        dir_part, file_part = self.join_path(pattern).rsplit('/', 1)
+        # NB: patterns that only match within a single directory are resolved with one scandir;
+        #  recursive or nested wildcards fall back to fsspec
+        if '**' in file_part or any(c in dir_part for c in '*?['):
+            return super().glob(pattern)
+        try:
+            with os.scandir(dir_part) as entries:
+                names = [entry.name for entry in entries]
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        return [f'{dir_part}/{name}' for name in sorted(fnmatch.filter(names, file_part))]
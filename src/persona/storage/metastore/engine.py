@@ -5,6 +5,7 @@ class provides the business logic for interacting with the metastore.
 """
 
 import logging
+import queue
 from typing import Generic, TypeVar, Generator, Literal, TYPE_CHECKING, Self
 import pathlib as plb
 from abc import abstractmethod, ABCMeta
@@ -25,7 +26,7 @@ T = TypeVar('T', bound=BaseMetaStoreConfig)
 
 
 class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
-    def __init__(self, config: T):
+    def __init__(self, config: T, embedding_model: str | None = None):
         self._logger = logging.getLogger(
             f'persona.storage.metastore.engine.{self.__class__.__name__}'
         )
@@ -33,6 +34,12 @@ class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
         self._metadata: list[tuple[Literal['upsert', 'delete'], IndexEntry]] = []
         self._transaction: Transaction | None = None
         self._bootstrapped: bool = False
+        # NB: idle read-only cursors are kept for reuse instead of being created per session
+        self._cursor_pool: queue.LifoQueue[CursorLike] = queue.LifoQueue(maxsize=8)
+        # NB: identifies the model that produced the stored embeddings, so they are only reused
+        #  when they come from the same model (see `FastEmbedder.model_id`)
+        self._embedding_model = embedding_model
+        self._stored_embedding_models: dict[str, str | None] = {}
 
     @abstractmethod
     def bootstrap(self) -> Self:
@@ -49,6 +56,27 @@ class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
         """Close the connection to the metastore backend."""
         ...
 
+    @property
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """Whether a connection to the metastore backend is open."""
+        ...
+
+    def flush(self) -> None:
+        """Persist pending changes without closing the connection. No-op by default."""
+        ...
+
+    def stored_embedding_model(self, table: str) -> str | None:
+        """Identifier of the embedding model recorded with a table when it was bootstrapped.
+
+        Args:
+            table (str): Name of the table
+
+        Returns:
+            str | None: The model identifier, or None if the table was not persisted with one.
+        """
+        return self._stored_embedding_models.get(table)
+
     @abstractmethod
     def get_cursor(self) -> CursorLike:
         """Get a new cursor for executing queries."""
@@ -61,14 +89,20 @@ class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
         Args:
             bootstrap (bool, optional): Whether to bootstrap the metastore upon connection. Defaults to False
         """
+        # NB: an engine that is already connected is shared (e.g. by the MCP server) and stays open
+        #  for its owner. Changes are still persisted when the context exits.
+        owns_connection = not self.is_connected
         try:
             self.connect()
             if bootstrap:
                 self.bootstrap()
             yield self
         finally:
-            self.close()
-            self._bootstrapped = False
+            if owns_connection:
+                self.close()
+                self._bootstrapped = False
+            else:
+                self.flush()
 
     @contextmanager
     def read_session(self) -> Generator[CursorLikeMetaStoreSession, None, None]:
@@ -81,12 +115,26 @@ class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
             Generator[CursorLikeMetaStore, None, None]: a cursor-like object containing methods like: execute(), fetchone(), fetchall()
         """
         self._logger.debug('Starting new read-only metastore session ...')
-        cursor = self.get_cursor()
+        try:
+            cursor = self._cursor_pool.get_nowait()
+        except queue.Empty:
+            cursor = self.get_cursor()
         try:
             yield CursorLikeMetaStoreSession(cursor)
         finally:
             self._logger.debug('Closing read-only session ...')
-            cursor.close()
+            try:
+                self._cursor_pool.put_nowait(cursor)
+            except queue.Full:
+                cursor.close()
+
+    def _close_cursor_pool(self) -> None:
+        """Close the idle read-only cursors. Must be called before the connection is closed."""
+        while True:
+            try:
+                self._cursor_pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     @contextmanager
     def session(self) -> Generator[CursorLikeMetaStoreSession, None, None]:
@@ -126,9 +174,13 @@ class CursorLikeMetaStoreEngine(Generic[T], metaclass=ABCMeta):
 
 class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
     def __init__(
-        self, config: DuckDBMetaStoreConfig, read_only: bool = True, tables: list[str] | None = None
+        self,
+        config: DuckDBMetaStoreConfig,
+        read_only: bool = True,
+        tables: list[str] | None = None,
+        embedding_model: str | None = None,
     ):
-        super().__init__(config=config)
+        super().__init__(config=config, embedding_model=embedding_model)
 
         self._conn: duckdb.DuckDBPyConnection | None = None
         self._logger.debug(
@@ -154,7 +206,12 @@ class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
             path_ = getattr(self._config, f'{table}_index_path')
             try:
                 self._logger.debug(f'Loading existing {table} index from disk ...')
-                self._conn.execute(f"INSERT INTO {table} SELECT * FROM read_parquet('{path_}');")
+                self._conn.read_parquet(path_).insert_into(table)
+                result = self._conn.execute(
+                    "SELECT value::VARCHAR FROM parquet_kv_metadata(?) WHERE key = 'embedding_model'",
+                    [path_],
+                ).fetchone()
+                self._stored_embedding_models[table] = None if result is None else result[0]
                 self._bootstrapped = True
             except duckdb.BinderException as e:
                 self._logger.error(
@@ -165,6 +222,7 @@ class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
                 self._logger.warning(
                     f'No existing {table} index found at {path_}: Table initialized empty ...'
                 )
+                self._stored_embedding_models[table] = None
                 self._bootstrapped = True
             except Exception as e:
                 self._logger.error('Unknown error when loading existing index.')
@@ -178,7 +236,13 @@ class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
         for table in self._tables:
             path_ = getattr(self._config, f'{table}_index_path')
             self._logger.debug(f'Exporting {table} index to disk at: {path_} ...')
-            self._conn.execute(f"""COPY "{table}" TO '{path_}' (FORMAT PARQUET);""")
+            options = 'FORMAT PARQUET, COMPRESSION zstd'
+            # NB: unless set explicitly, keep the model recorded when the table was loaded
+            embedding_model = self._embedding_model or self._stored_embedding_models.get(table)
+            if embedding_model is not None:
+                options += f", KV_METADATA {{embedding_model: '{embedding_model}'}}"
+            # NB: ZSTD compresses the embedding columns better than the default snappy codec
+            self._conn.execute(f"""COPY "{table}" TO '{path_}' ({options});""")
 
     def connect(self) -> Self:
         if self._conn is not None:
@@ -186,12 +250,15 @@ class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
                 'DuckDB connection already established. To open a new connection, close the existing one first.'
             )
             return self
+        self._conn = duckdb.connect(database=':memory:persona')
+        if not self._uses_remote_storage():
+            # NB: local index files are read directly, so the http extensions are not needed
+            return self
         cache_dir = (
             plb.Path(user_cache_dir('persona', 'jasper_ginn', ensure_exists=True)) / 'duckdb'
         )
         cache_dir.mkdir(parents=True, exist_ok=True)
         self._logger.debug(f'Using DuckDB cache directory at: {str(cache_dir)}')
-        self._conn = duckdb.connect(database=':memory:persona')
         self._conn.execute(
             'INSTALL httpfs; LOAD httpfs; INSTALL cache_httpfs FROM community; LOAD cache_httpfs;'
         )
@@ -203,9 +270,23 @@ class DuckDBMetaStoreEngine(CursorLikeMetaStoreEngine[DuckDBMetaStoreConfig]):
         )  # this checks for updated files on read
         return self
 
+    def _uses_remote_storage(self) -> bool:
+        """Whether the index files live on a remote filesystem (e.g. s3://, gs://, https://)."""
+        root = self._config.root or ''
+        return '://' in root and not root.startswith('file://')
+
+    @property
+    def is_connected(self) -> bool:
+        return self._conn is not None
+
+    def flush(self) -> None:
+        if self._conn is not None and not self._read_only:
+            self._export_tables()
+
     def close(self):
         if self._conn is not None:
             self._logger.debug('Closing DuckDB connection ...')
+            self._close_cursor_pool()
             if not self._read_only:
                 # NB: dump tables to storage
                 self._export_tables()
@@ -1,6 +1,9 @@
 import logging
 from abc import abstractmethod, ABCMeta
+from functools import cache
+from typing import Any
 
+import numpy as np
 import pyarrow as pa
 
 from persona.storage.metastore.utils import CursorLike
@@ -67,6 +70,22 @@ class BaseMetaStoreSession(metaclass=ABCMeta):
         """
         ...
 
+    @abstractmethod
+    def get_record(
+        self, table_name: str, key: str, column_filter: list[str] | None = None
+    ) -> dict[str, Any] | None:
+        """Retrieve a single record as a dictionary, without materializing a pyarrow Table
+
+        Args:
+            table_name (str): name of the table from which to retrieve the record. Should be one of persona.types.personaTypes
+            key (str): key ('name' field) of the record to retrieve
+            column_filter (list[str] | None, optional): list of columns to retrieve. Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: the retrieved record, or None if it does not exist
+        """
+        ...
+
     @abstractmethod
     def get_many(
         self,
@@ -86,10 +105,33 @@ class BaseMetaStoreSession(metaclass=ABCMeta):
         """
         ...
 
+    @abstractmethod
+    def get_many_batches(
+        self,
+        table_name: str,
+        row_filter: list[str] | None = None,
+        column_filter: list[str] | None = None,
+        batch_size: int = 4096,
+    ) -> pa.RecordBatchReader:
+        """Retrieve multiple records as a stream of record batches
+
+        The reader must be consumed before the session is closed.
+
+        Args:
+            table_name (str): name of the table from which to retrieve the records. Should be one of persona.types.personaTypes
+            row_filter (list[str] | None, optional): list of keys ('name' fields) of the records to retrieve. Defaults to None.
+            column_filter (list[str] | None, optional): list of columns to retrieve. Defaults to None.
+            batch_size (int, optional): maximum number of rows per record batch. Defaults to 4096.
+
+        Returns:
+            pa.RecordBatchReader: reader yielding the retrieved records
+        """
+        ...
+
     @abstractmethod
     def search(
         self,
-        query: list[float],
+        query: list[float] | np.ndarray,
         table_name: str,
         column_filter: list[str] | None = None,
         limit: int = 5,
@@ -98,7 +140,7 @@ class BaseMetaStoreSession(metaclass=ABCMeta):
         """Search for records based on a query embedding
 
         Args:
-            query (list[float]): query embedding vector
+            query (list[float] | np.ndarray): query embedding vector
             table_name (str): name of the table to search in. Should be one of persona.types.personaTypes
             limit (int, optional): maximum number of results to return. Defaults to 5.
             max_cosine_distance (float | None, optional): maximum cosine distance for filtering results. Defaults to None.
@@ -109,6 +151,21 @@ class BaseMetaStoreSession(metaclass=ABCMeta):
         ...
 
 
+# NB: matches the table DDL, so DuckDB can ingest the columns without per-value casts
+UPSERT_SCHEMA = pa.schema(
+    [
+        ('name', pa.string()),
+        ('date_created', pa.string()),
+        ('description', pa.string()),
+        ('tags', pa.list_(pa.string())),
+        ('uuid', pa.string()),
+        ('etag', pa.string()),
+        ('files', pa.list_(pa.string())),
+        ('embedding', pa.list_(pa.float32(), 384)),
+    ]
+)
+
+
 class CursorLikeMetaStoreSession(BaseMetaStoreSession):
     @staticmethod
     def _get_column_filter(column_filter: list[str] | None) -> str:
@@ -118,9 +175,62 @@ class CursorLikeMetaStoreSession(BaseMetaStoreSession):
             columns = '*'
         return columns
 
+    @staticmethod
+    @cache
+    def _select_by_key_sql(table_name: str, column_filter: tuple[str, ...] | None) -> str:
+        # NB: the shapes requested on the hot paths (skill versions, skill files, definitions)
+        #  are few, so the SQL text is built once per (table, columns) pair and reused.
+        columns = CursorLikeMetaStoreSession._get_column_filter(
+            None if column_filter is None else list(column_filter)
+        )
+        return f'SELECT {columns} FROM "{table_name}" WHERE name = ?'
+
+    @staticmethod
+    def _select_many_sql(
+        table_name: str, column_filter: list[str] | None, filter_rows: bool
+    ) -> str:
+        sql = f'SELECT {CursorLikeMetaStoreSession._get_column_filter(column_filter)} FROM "{table_name}"'
+        if filter_rows:
+            sql += ' WHERE name = ANY(?)'
+        return sql
+
+    @staticmethod
+    @cache
+    def _search_sql(
+        table_name: str, column_filter: tuple[str, ...] | None, filter_distance: bool
+    ) -> str:
+        # NB: the distance threshold and limit are bound as parameters so that the SQL text only
+        #  depends on the table and the requested columns.
+        columns = CursorLikeMetaStoreSession._get_column_filter(
+            None if column_filter is None else list(column_filter)
+        )
+        columns += ',ROUND(array_cosine_distance(embedding, ?::FLOAT[384])::DOUBLE, 3) as score'
+        sql = f"""
+        WITH search_results AS (
+            SELECT {columns},
+            FROM "{table_name}"
+        )
+        SELECT * FROM search_results
+        """
+        if filter_distance:
+            sql += 'WHERE score <= ?'
+        return sql + ' ORDER BY score ASC LIMIT ?'
+
     def upsert(self, table_name: str, data: list[dict[str, str | list[str]]]):
-        sql = f'INSERT OR REPLACE INTO "{table_name}" (name, date_created, description, tags, uuid, etag, files, embedding) VALUES ($name, $date_created, $description, $tags, $uuid, $etag, $files, $embedding)'
-        self._cursor.executemany(sql, data)
+        # NB: all records are inserted with a single statement over an Arrow table instead of one
+        #  execution per record. A statement cannot replace the same row twice, so only the last
+        #  record for each name is kept.
+        records = list({record['name']: record for record in data}.values())
+        columns = ', '.join(UPSERT_SCHEMA.names)
+        self._cursor.register(
+            '_upsert_records', pa.Table.from_pylist(records, schema=UPSERT_SCHEMA)
+        )
+        try:
+            self._cursor.execute(
+                f'INSERT OR REPLACE INTO "{table_name}" ({columns}) SELECT {columns} FROM _upsert_records'
+            )
+        finally:
+            self._cursor.unregister('_upsert_records')
 
     def truncate_tables(self):
         sql = 'TRUNCATE roles; TRUNCATE skills;'
@@ -131,47 +241,68 @@ class CursorLikeMetaStoreSession(BaseMetaStoreSession):
         self._cursor.execute(sql, [keys])
 
     def exists(self, table_name: str, key: str) -> bool:
-        sql = f'SELECT 1 FROM "{table_name}" WHERE name = ? LIMIT 1'
+        sql = self._select_by_key_sql(table_name, ('name',))
         result = self._cursor.execute(sql, [key]).fetchone()
         return result is not None
 
     def get_one(
         self, table_name: str, key: str, column_filter: list[str] | None = None
     ) -> pa.Table:
-        sql = f'SELECT {self._get_column_filter(column_filter)} FROM "{table_name}" WHERE name = ?'
+        sql = self._select_by_key_sql(
+            table_name, None if column_filter is None else tuple(column_filter)
+        )
         return self._cursor.execute(sql, [key]).fetch_arrow_table()
 
+    def get_record(
+        self, table_name: str, key: str, column_filter: list[str] | None = None
+    ) -> dict[str, Any] | None:
+        sql = self._select_by_key_sql(
+            table_name, None if column_filter is None else tuple(column_filter)
+        )
+        result = self._cursor.execute(sql, [key])
+        row = result.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in result.description], row))
+
     def get_many(
         self,
         table_name: str,
         row_filter: list[str] | None = None,
         column_filter: list[str] | None = None,
     ) -> pa.Table:
-        sql = f'SELECT {self._get_column_filter(column_filter)} FROM "{table_name}"'
-        if row_filter is not None:
-            sql += ' WHERE name = ANY(?)'
+        sql = self._select_many_sql(table_name, column_filter, row_filter is not None)
         return self._cursor.execute(
             sql, [] if row_filter is None else [row_filter]
         ).fetch_arrow_table()
 
+    def get_many_batches(
+        self,
+        table_name: str,
+        row_filter: list[str] | None = None,
+        column_filter: list[str] | None = None,
+        batch_size: int = 4096,
+    ) -> pa.RecordBatchReader:
+        sql = self._select_many_sql(table_name, column_filter, row_filter is not None)
+        return self._cursor.execute(
+            sql, [] if row_filter is None else [row_filter]
+        ).fetch_record_batch(batch_size)
+
     def search(
         self,
-        query: list[float],
+        query: list[float] | np.ndarray,
         table_name: str,
         column_filter: list[str] | None = None,
         limit: int = 5,
         max_cosine_distance: float = 0.8,
     ) -> pa.Table:
-        columns = self._get_column_filter(column_filter)
-        columns += ',ROUND(array_cosine_distance(embedding, ?::FLOAT[384])::DOUBLE, 3) as score'
-        sql = f"""
-        WITH search_results AS (
-            SELECT {columns},
-            FROM "{table_name}"
+        sql = self._search_sql(
+            table_name,
+            None if column_filter is None else tuple(column_filter),
+            max_cosine_distance is not None,
         )
-        SELECT * FROM search_results
-        """
+        params: list[Any] = [query]
         if max_cosine_distance is not None:
-            sql += f'WHERE score <= {max_cosine_distance}'
-        sql += f' ORDER BY score ASC LIMIT {limit}'
-        return self._cursor.execute(sql, [query]).fetch_arrow_table()
+            params.append(max_cosine_distance)
+        params.append(limit)
+        return self._cursor.execute(sql, params).fetch_arrow_table()
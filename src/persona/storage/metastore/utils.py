@@ -13,3 +13,7 @@ class CursorLike(Protocol):
     def execute(self, query: str, parameters: list | None = None) -> Any: ...
 
     def executemany(self, query: str, parameters: list | None = None) -> Any: ...
+
+    def register(self, view_name: str, python_object: object) -> Any: ...
+
+    def unregister(self, view_name: str) -> Any: ...
@@ -3,7 +3,6 @@ import hashlib
 from typing import Any, Literal, TYPE_CHECKING, cast
 
 import orjson
-from pydantic import RootModel, Field
 
 
 if TYPE_CHECKING:
@@ -11,20 +10,28 @@ if TYPE_CHECKING:
     from persona.storage.metastore import CursorLikeMetaStoreEngine, BaseMetaStoreSession
 
 
-class TemplateHashValues(RootModel[dict[str, str]]):
-    root: dict[str, str] = Field(default_factory=dict)
+class TemplateHashValues:
+    """Content hashes of the files written during a transaction, keyed by file."""
+
+    __slots__ = ('root',)
+
+    def __init__(self) -> None:
+        self.root: dict[str, str] = {}
 
     def _hash_content(self, content: bytes) -> str:
-        return hashlib.md5(content).hexdigest()
+        # NB: only used as a fingerprint for the transaction, not for security. BLAKE2b with a
+        #  16-byte digest is faster than MD5 and keeps the 32-character hex ids.
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
 
     def add(self, file: str, content: bytes) -> None:
         self.root[file] = self._hash_content(content)
 
     def hash(self, exclude: set[str] | None = None) -> str:
-        model_dump = {
-            k: v for k, v in self.model_dump().items() if exclude is None or k not in exclude
-        }
-        return self._hash_content(orjson.dumps(model_dump, option=orjson.OPT_SORT_KEYS))
+        if not exclude or self.root.keys().isdisjoint(exclude):
+            hashes = self.root
+        else:
+            hashes = {k: v for k, v in self.root.items() if k not in exclude}
+        return self._hash_content(orjson.dumps(hashes, option=orjson.OPT_SORT_KEYS))
 
 
 class Transaction:
@@ -35,12 +42,22 @@ class Transaction:
         self._file_store = file_store
         self._meta_store_engine = meta_store_engine
         self._log: list[tuple[Literal['restore', 'delete'], str, Any]] = []
+        self._logged_keys: set[str] = set()
         self._hashes = TemplateHashValues()
 
+    def _has_log_entry(self, key: str) -> bool:
+        return key in self._logged_keys
+
     def _add_log_entry(
         self, action: Literal['restore', 'delete'], key: str, data: Any = None
     ) -> None:
+        # NB: the first entry for a key holds its state before the transaction, which is what
+        #  a rollback restores. Later entries for the same key are redundant.
+        if key in self._logged_keys:
+            self._logger.debug(f'Key {key} already logged; skipping action: {action}')
+            return
         self._logger.debug(f'Logging action: {action} for key: {key}')
+        self._logged_keys.add(key)
         self._log.append((action, key, data))
 
     def _add_file_hash(self, file: str, content: bytes) -> None:
@@ -49,30 +66,36 @@ class Transaction:
     def _process_metadata(
         self,
     ) -> dict[str, list[str] | list[dict[str, str | list[str]]] | str] | None:
-        types: list[str] = []
+        type_: str | None = None
         deletes: list[str] = []
         upserts: list[dict[str, str | list[str]]] = []
+        # NB: the file hashes do not change while metadata is processed, so the id is hashed once
+        transaction_id: str | None = None
 
         for action, entry in self._meta_store_engine._metadata:
             if entry.uuid is None:
-                entry.update('uuid', self.transaction_id)
+                if transaction_id is None:
+                    transaction_id = self.transaction_id
+                entry.update('uuid', transaction_id)
             if action == 'delete':
                 if entry.name is not None:
                     deletes.append(entry.name)
             elif action == 'upsert':
                 upserts.append(entry.model_dump(exclude={'type'}))
             if entry.type is not None:
-                types.append(entry.type)
+                if type_ is None:
+                    type_ = entry.type
+                elif entry.type != type_:
+                    raise ValueError(
+                        'All index entries must have the same type for a single transaction.'
+                    )
 
-        type_ = list(set(types))
-        if len(type_) > 1:
-            raise ValueError('All index entries must have the same type for a single transaction.')
-        elif len(type_) == 0:
+        if type_ is None:
             self._logger.debug('No metadata to update in index.')
             return None
 
         return {
-            'type': type_[0],
+            'type': type_,
             'deletes': deletes,
             'upserts': upserts,
         }
@@ -105,12 +128,23 @@ class Transaction:
         """Rollback all changes made during the transaction."""
         self._logger.debug('Rolling back transaction...')
 
+        # NB: only the earliest entry per key describes the state before the transaction, so
+        #  walking the log backwards lets it overwrite any later entries for the same key
+        restores: dict[str, bytes] = {}
+        deletes: dict[str, None] = {}
         for action, key, data in reversed(self._log):
-            # NB: use internal methods to avoid logging during rollback
             if action == 'restore':
-                self._file_store._save(key, data)
+                restores[key] = data
+                deletes.pop(key, None)
             elif action == 'delete':
-                self._file_store._delete(key, recursive=False)
+                deletes[key] = None
+                restores.pop(key, None)
+
+        # NB: use internal methods to avoid logging during rollback
+        if deletes:
+            self._file_store._delete_many(list(deletes))
+        if restores:
+            self._file_store._save_many(restores)
 
     def __enter__(self) -> 'Transaction':
         self._logger.debug('Starting transaction...')
@@ -149,8 +183,8 @@ class Transaction:
                             option=orjson.OPT_INDENT_2,
                         ),
                     )
-                # NB: for DuckDB, closing the `connected` object will trigger an export of the
-                #  data to storage as parquet
+                # NB: for DuckDB, exiting the `connected` context will trigger an export of the
+                #  data to storage as parquet, also when the engine's connection is shared
                 with self._meta_store_engine.open(bootstrap=True) as connected:
                     with connected.session() as session:
                         self._update_index(
@@ -170,4 +204,8 @@ class Transaction:
             self._file_store._transaction = None
             self._meta_store_engine._transaction = None
 
-            self._log = []
+            # NB: the engine outlives the transaction, so its staged metadata is cleared in place
+            #  and the list is reused by the next transaction
+            self._meta_store_engine._metadata.clear()
+            self._log.clear()
+            self._logged_keys.clear()
@@ -3,10 +3,12 @@ import logging
 import hashlib
 from abc import abstractmethod
 import pathlib as plb
-from typing import Literal, Self, cast
+from types import MappingProxyType
+from typing import Literal, Mapping, Self, cast
 import frontmatter
+from frontmatter.default_handlers import BaseHandler
 from typing_extensions import Annotated
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from pydantic import Field, BaseModel, field_validator, TypeAdapter, model_validator
 
@@ -28,6 +30,28 @@ def _is_persona_root_file(path: plb.Path) -> bool:
     return path.name in ['ROLE.md', 'SKILL.md']
 
 
+@lru_cache(maxsize=256)
+def parse_frontmatter(
+    content: bytes,
+) -> tuple[Mapping[str, object], str, BaseHandler | None]:
+    """Parse the frontmatter of a template file.
+
+    Results are cached on the raw file content, so an unchanged template is only parsed once
+    while an edited template is always parsed again. Because the result is shared between
+    callers, the returned metadata must not be mutated: the top-level mapping is a read-only
+    view, but nested values (e.g. lists of tags) are not frozen. Copy them before modifying.
+
+    Args:
+        content (bytes): Raw content of the template file (e.g. ROLE.md or SKILL.md).
+
+    Returns:
+        tuple[Mapping[str, object], str, BaseHandler | None]: Frontmatter metadata,
+            the template body and the handler that matched the frontmatter format (e.g. YAML or TOML).
+    """
+    post = frontmatter.loads(content.decode('utf-8'))
+    return MappingProxyType(post.metadata or {}), post.content, post.handler
+
+
 class SourceFile:
     def __init__(
         self,
@@ -125,6 +149,40 @@ class Template(BaseModel):
         fm = frontmatter.loads(content)
         return fm.metadata
 
+    def _embed_description(
+        self,
+        name: str,
+        description: str,
+        meta_store_engine: CursorLikeMetaStoreEngine,
+        embedder: FastEmbedder,
+    ) -> list[float]:
+        """Embed a template description, reusing the stored embedding if the description did not change.
+
+        Args:
+            name (str): Name of the template.
+            description (str): Description of the template.
+            meta_store_engine (CursorLikeMetaStoreEngine): Metastore engine holding the current index.
+            embedder (FastEmbedder): Embedding model used to embed the template description.
+
+        Returns:
+            list[float]: The embedding of the description.
+        """
+        type_ = self.get_type()
+        # NB: stored embeddings are only reused if they were produced by the current model
+        if (
+            meta_store_engine.is_connected
+            and meta_store_engine.stored_embedding_model(type_) == embedder.model_id
+        ):
+            with meta_store_engine.read_session() as session:
+                record = session.get_record(type_, name, ['description', 'embedding'])
+            if (
+                record is not None
+                and record['description'] == description
+                and record['embedding'] is not None
+            ):
+                return list(record['embedding'])
+        return embedder.encode([description]).squeeze().tolist()
+
     def process_template(
         self,
         entry: IndexEntry,
@@ -157,7 +215,10 @@ class Template(BaseModel):
                 'Template must have a name and description either in the frontmatter or provided during registration.'
             )
 
-        entry.update('embedding', embedder.encode([entry.description]).squeeze().tolist())
+        entry.update(
+            'embedding',
+            self._embed_description(entry.name, entry.description, meta_store_engine, embedder),
+        )
 
         if entry.tags is None or cast(list[str] | None, metadata.get('tags', None)) is None:
             tags = tagger.extract_tags(ids=[entry.name], texts=[entry.description])
@@ -1,9 +1,10 @@
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pyarrow as pa
 from typer.testing import CliRunner
 
-from persona.cli.utils import create_cli
+from persona.cli.utils import create_cli, _get_known_embeddings
 
 
 def test_create_cli_list(runner: CliRunner) -> None:
@@ -68,3 +69,36 @@ def test_create_cli_remove(runner: CliRunner) -> None:
         # Assert
         assert result.exit_code == 0
         mock_remove.assert_called_once()
+
+
+def test_get_known_embeddings() -> None:
+    meta_store = MagicMock()
+    connected = meta_store.open.return_value.__enter__.return_value
+    connected.stored_embedding_model.return_value = 'model-a'
+    session = connected.read_session.return_value.__enter__.return_value
+    session.get_many_batches.return_value = pa.table(
+        {
+            'description': ['a', None, 'c'],
+            'embedding': pa.array([[0.5, 0.25], [0.3, 0.4], None], type=pa.list_(pa.float32(), 2)),
+        }
+    ).to_batches()
+    known = _get_known_embeddings(meta_store, ['roles'], embedding_model='model-a')
+    assert list(known) == ['a']
+    assert known['a'].tolist() == [0.5, 0.25]
+    session.get_many_batches.assert_called_once_with(
+        'roles', column_filter=['description', 'embedding']
+    )
+
+
+def test_get_known_embeddings_unreadable_index() -> None:
+    meta_store = MagicMock()
+    meta_store.open.side_effect = RuntimeError('schema mismatch')
+    assert _get_known_embeddings(meta_store, ['roles', 'skills'], embedding_model='model-a') == {}
+
+
+def test_get_known_embeddings_other_model() -> None:
+    meta_store = MagicMock()
+    connected = meta_store.open.return_value.__enter__.return_value
+    connected.stored_embedding_model.return_value = 'model-a'
+    assert _get_known_embeddings(meta_store, ['roles'], embedding_model='model-b') == {}
+    connected.read_session.return_value.__enter__.return_value.get_many_batches.assert_not_called()
@@ -1,81 +1,70 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import pathlib as plb
-from persona.mcp.utils.lib import _get_builtin_skills
+from persona.mcp.utils.lib import _get_builtin_skills, _get_prompts, get_library_skills
 
 
-def test_get_builtin_skills() -> None:
+def test_get_builtin_skills(tmp_path: plb.Path) -> None:
     # Arrange
-    mock_path = MagicMock(spec=plb.Path)
-
     # Structure:
     # library/assets/skills/
     #   skill1/
     #     SKILL.md
-    #     script.py
+    #     scripts/script.py
     #   skill2/
     #     SKILL.md
+    #   not_a_skill/
+    #     README.md
+    (tmp_path / 'skill1' / 'scripts').mkdir(parents=True)
+    (tmp_path / 'skill1' / 'SKILL.md').write_bytes(b'skill1 content')
+    (tmp_path / 'skill1' / 'scripts' / 'script.py').write_bytes(b"print('hello')")
+    (tmp_path / 'skill2').mkdir()
+    (tmp_path / 'skill2' / 'SKILL.md').write_bytes(b'skill2 content')
+    (tmp_path / 'not_a_skill').mkdir()
+    (tmp_path / 'not_a_skill' / 'README.md').write_bytes(b'readme')
 
-    mock_skill1_md = MagicMock(spec=plb.Path)
-    mock_skill1_md.name = 'SKILL.md'
-    mock_skill1_md.parent.name = 'skill1'
-    mock_skill1_md.read_bytes.return_value = b'skill1 content'
-    mock_skill1_md.suffix = '.md'
-    mock_skill1_md.relative_to.return_value = plb.Path('skill1/SKILL.md')
-    mock_skill1_md.is_dir.return_value = False
+    with patch('persona.mcp.utils.lib.library_skills_path', tmp_path):
+        # Act
+        skills = _get_builtin_skills()
 
-    mock_skill1_script = MagicMock(spec=plb.Path)
-    mock_skill1_script.name = 'script.py'
-    mock_skill1_script.parent.name = 'skill1'  # parent name is consistent
-    mock_skill1_script.read_bytes.return_value = b"print('hello')"
-    mock_skill1_script.suffix = '.py'
-    mock_skill1_script.relative_to.return_value = plb.Path('skill1/script.py')
-    mock_skill1_script.is_dir.return_value = False
+    # Assert
+    assert set(skills) == {'skill1', 'skill2'}
 
-    mock_skill2_md = MagicMock(spec=plb.Path)
-    mock_skill2_md.name = 'SKILL.md'
-    mock_skill2_md.parent.name = 'skill2'
-    mock_skill2_md.read_bytes.return_value = b'skill2 content'
-    mock_skill2_md.suffix = '.md'
-    mock_skill2_md.relative_to.return_value = plb.Path('skill2/SKILL.md')
-    mock_skill2_md.is_dir.return_value = False
+    assert skills['skill1']['SKILL.md'].content == b'skill1 content'
+    assert skills['skill1']['SKILL.md'].storage_file_path == 'skill1/SKILL.md'
+    assert skills['skill1']['SKILL.md'].extension == '.md'
+    assert skills['skill1']['script.py'].content == b"print('hello')"
+    assert skills['skill1']['script.py'].storage_file_path == 'skill1/scripts/script.py'
+    assert skills['skill1']['script.py'].extension == '.py'
 
-    # The glob for SKILL.md
-    mock_path.glob.side_effect = lambda pattern: {
-        '*/SKILL.md': [mock_skill1_md, mock_skill2_md],
-    }.get(pattern, [])
+    assert set(skills['skill2']) == {'SKILL.md'}
 
-    # The recursive glob for files in skill dir
-    # We need to make sure mock_skill1_md.parent returns the mock that we set glob on.
-    # MagicMock creates a new mock on access if not set.
 
-    mock_skill1_dir = MagicMock()
-    mock_skill1_dir.name = 'skill1'
-    mock_skill1_dir.glob.return_value = [mock_skill1_md, mock_skill1_script]
-    mock_skill1_md.parent = mock_skill1_dir
-    mock_skill1_script.parent = mock_skill1_dir
+def test_get_prompts(tmp_path: plb.Path) -> None:
+    # Arrange
+    (tmp_path / 'roleplay.md').write_text('\nRoleplay template\n')
+    (tmp_path / 'review.md').write_text('Review template')
 
-    mock_skill2_dir = MagicMock()
-    mock_skill2_dir.name = 'skill2'
-    mock_skill2_dir.glob.return_value = [mock_skill2_md]
-    mock_skill2_md.parent = mock_skill2_dir
+    with patch('persona.mcp.utils.lib.prompts_path', tmp_path):
+        # Act
+        prompts = _get_prompts()
 
-    # Important: The code iterates `library_skills_path.glob(...)`.
-    # It gets `skill_path` (e.g. mock_skill1_md).
-    # Then access `skill_path.parent`.
-    # So `mock_skill1_md.parent` must be `mock_skill1_dir`.
+    # Assert
+    assert prompts == {'roleplay': 'Roleplay template', 'review': 'Review template'}
 
-    with patch('persona.mcp.utils.lib.library_skills_path', mock_path):
-        # Act
-        skills = _get_builtin_skills()
 
-        # Assert
-        assert 'skill1' in skills
-        assert 'skill2' in skills
+def test_get_library_skills_cached() -> None:
+    # Arrange
+    get_library_skills.cache_clear()
 
-        assert 'SKILL.md' in skills['skill1']
-        assert 'script.py' in skills['skill1']
-        assert skills['skill1']['SKILL.md'].content == b'skill1 content'
-        assert skills['skill1']['script.py'].content == b"print('hello')"
+    with patch(
+        'persona.mcp.utils.lib._get_builtin_skills', return_value={'skill1': {}}
+    ) as mock_get_builtin_skills:
+        # Act
+        skills = get_library_skills()
+        skills_again = get_library_skills()
 
-        assert 'SKILL.md' in skills['skill2']
-        assert 'script.py' not in skills['skill2']
+    # Assert
+    assert skills == {'skill1': {}}
+    assert skills_again is skills
+    mock_get_builtin_skills.assert_called_once()
+    get_library_skills.cache_clear()
@@ -8,6 +8,7 @@ from persona.mcp.utils.lifespan import (
     get_embedder,
     get_config,
     get_meta_store_session,
+    get_prompt,
 )
 from persona.mcp.models import AppContext
 from persona.config import PersonaConfig
@@ -50,7 +51,7 @@ async def test_lifespan_initialization(tmp_path: plb.Path) -> None:
 
     with (
         patch('persona.mcp.utils.lifespan.os.environ.get', return_value=None),
-        patch('persona.mcp.utils.lifespan.yaml.safe_load', return_value={}),
+        patch('persona.mcp.utils.lifespan.read_config_file', return_value={}),
         patch(
             'persona.mcp.utils.lifespan.PersonaConfig.model_validate',
             return_value=MagicMock(model_dump=lambda: {}),
@@ -70,6 +71,8 @@ async def test_lifespan_initialization(tmp_path: plb.Path) -> None:
             assert app_ctx._meta_store_engine is mock_meta_store_engine
             assert app_ctx._embedding_model is mock_embedder
             assert app_ctx._api is mock_api
+            assert 'roleplay' in app_ctx._prompts
+            mock_embedder.encode.assert_called_once_with(['warmup'])
 
             # Verify metastore closed on exit
             mock_meta_store_engine.close.assert_not_called()
@@ -99,11 +102,14 @@ def test_get_helpers() -> None:
     mock_config = MagicMock()
     mock_app_context.config = mock_config
 
+    mock_app_context._prompts = {'roleplay': 'Roleplay template'}
+
     # Test getters
     assert get_api(mock_ctx) is mock_api
     assert get_file_store(mock_ctx) is mock_file_store
     assert get_embedder(mock_ctx) is mock_embedder
     assert get_config(mock_ctx) is mock_config
+    assert get_prompt(mock_ctx, 'roleplay') == 'Roleplay template'
 
 
 def test_get_meta_store_session() -> None:
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, patch
 from fastmcp import Context
 from persona.mcp.server import (
     list_roles,
@@ -138,91 +138,61 @@ def test_match_skill(mock_context: MagicMock, mock_api: MagicMock) -> None:
     assert result[0].name == 'skill1'
 
 
-# Async prompt tests
-# We mock aiofiles.open to return a mock object that supports async read
+# Prompt tests
+# Prompt templates are loaded once in the lifespan, so we mock the accessor
 
 
-@pytest.mark.asyncio
-async def test_persona_roleplay() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Template content'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await persona_roleplay.fn('my description')
+def test_persona_roleplay(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Template content') as mock_get:
+        result = persona_roleplay.fn(mock_context, 'my description')
 
+    mock_get.assert_called_once_with(mock_context, 'roleplay')
     assert 'Template content' in result
     assert 'my description' in result
 
 
-@pytest.mark.asyncio
-async def test_persona_template() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Template content'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await persona_template.fn('my description')
+def test_persona_template(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Template content') as mock_get:
+        result = persona_template.fn(mock_context, 'my description')
 
+    mock_get.assert_called_once_with(mock_context, 'template')
     assert 'Template content' in result
     assert 'my description' in result
 
 
-@pytest.mark.asyncio
-async def test_persona_review() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Review template'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await persona_review.fn('role def', chat_history='history')
+def test_persona_review(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Review template') as mock_get:
+        result = persona_review.fn(mock_context, 'role def', chat_history='history')
 
+    mock_get.assert_called_once_with(mock_context, 'review')
     assert 'Review template' in result
     assert 'role def' in result
     assert 'history' in result
 
 
-@pytest.mark.asyncio
-async def test_persona_edit() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Edit template'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await persona_edit.fn('role def', feedback='bad')
+def test_persona_edit(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Edit template') as mock_get:
+        result = persona_edit.fn(mock_context, 'role def', feedback='bad')
 
+    mock_get.assert_called_once_with(mock_context, 'edit')
     assert 'Edit template' in result
     assert 'role def' in result
     assert 'bad' in result
 
 
-@pytest.mark.asyncio
-async def test_skill_deploy() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Deploy template'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await skill_deploy.fn('do task')
+def test_skill_deploy(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Deploy template') as mock_get:
+        result = skill_deploy.fn(mock_context, 'do task')
 
+    mock_get.assert_called_once_with(mock_context, 'skill_deploy')
     assert 'Deploy template' in result
     assert 'do task' in result
 
 
-@pytest.mark.asyncio
-async def test_skill_update() -> None:
-    mock_file = AsyncMock()
-    mock_file.read.return_value = 'Update template'
-    mock_open = MagicMock()
-    mock_open.__aenter__.return_value = mock_file
-
-    with patch('aiofiles.open', return_value=mock_open):
-        result = await skill_update.fn('my_skill')
+def test_skill_update(mock_context: MagicMock) -> None:
+    with patch('persona.mcp.server.get_prompt', return_value='Update template') as mock_get:
+        result = skill_update.fn(mock_context, 'my_skill')
 
+    mock_get.assert_called_once_with(mock_context, 'skill_update')
     assert 'Update template' in result
     assert 'my_skill' in result
@@ -23,6 +23,18 @@ def test_connect(engine: DuckDBMetaStoreEngine) -> None:
         engine.connect()
 
         assert engine._conn == mock_conn
+        # Local index files do not need the http extensions
+        mock_conn.execute.assert_not_called()
+
+
+def test_connect_remote_loads_extensions() -> None:
+    engine = DuckDBMetaStoreEngine(DuckDBMetaStoreConfig(root='gs://bucket/persona'))
+    with patch('duckdb.connect') as mock_connect:
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+
+        engine.connect()
+
         # Verify extension loading calls
         mock_conn.execute.assert_any_call(
             'INSTALL httpfs; LOAD httpfs; INSTALL cache_httpfs FROM community; LOAD cache_httpfs;'
@@ -54,6 +66,10 @@ def test_bootstrap(engine: DuckDBMetaStoreEngine) -> None:
         assert any('roles' in str(c) for c in calls)
         assert any('skills' in str(c) for c in calls)
 
+        # Verify existing indexes are loaded through the relational API
+        mock_conn.read_parquet.assert_any_call(engine._config.roles_index_path)
+        mock_conn.read_parquet.return_value.insert_into.assert_any_call('skills')
+
 
 def test_close(engine: DuckDBMetaStoreEngine) -> None:
     with patch('duckdb.connect') as mock_connect:
@@ -67,6 +83,38 @@ def test_close(engine: DuckDBMetaStoreEngine) -> None:
         mock_conn.close.assert_called_once()
 
 
+def test_open_keeps_shared_connection(engine: DuckDBMetaStoreEngine) -> None:
+    with patch('duckdb.connect') as mock_connect:
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        engine.connect()
+
+        with engine.open(bootstrap=False):
+            pass
+
+        assert engine.is_connected
+        mock_conn.close.assert_not_called()
+
+        engine.close()
+        assert not engine.is_connected
+
+
+def test_open_flushes_shared_connection(engine: DuckDBMetaStoreEngine) -> None:
+    engine._read_only = False
+
+    with patch('duckdb.connect') as mock_connect:
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        engine.connect()
+
+        with engine.open(bootstrap=False):
+            pass
+
+        export_calls = [c for c in mock_conn.execute.call_args_list if 'COPY' in str(c)]
+        assert len(export_calls) == 2
+        mock_conn.close.assert_not_called()
+
+
 def test_close_read_write_exports(engine: DuckDBMetaStoreEngine) -> None:
     # Set engine to read-write
     engine._read_only = False
@@ -81,6 +129,7 @@ def test_close_read_write_exports(engine: DuckDBMetaStoreEngine) -> None:
         # Verify export
         export_calls = [c for c in mock_conn.execute.call_args_list if 'COPY' in str(c)]
         assert len(export_calls) >= 2  # Export for roles and skills
+        assert all('COMPRESSION zstd' in str(c) for c in export_calls)
 
 
 def test_session_context(engine: DuckDBMetaStoreEngine) -> None:
@@ -112,3 +161,44 @@ def test_session_rollback_on_error(engine: DuckDBMetaStoreEngine) -> None:
 
         mock_cursor.rollback.assert_called_once()
         mock_cursor.close.assert_called_once()
+
+
+def test_read_session_reuses_cursor(engine: DuckDBMetaStoreEngine) -> None:
+    with patch('duckdb.connect') as mock_connect:
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+        engine.connect()
+
+        with engine.read_session() as first:
+            pass
+        with engine.read_session() as second:
+            pass
+
+        mock_conn.cursor.assert_called_once()
+        assert first._cursor is second._cursor
+        first._cursor.close.assert_not_called()
+
+        # Pooled cursors are closed together with the connection
+        engine.close()
+        first._cursor.close.assert_called_once()
+
+
+def test_embedding_model_round_trip(config: DuckDBMetaStoreConfig) -> None:
+    Path(config.index_path).mkdir(parents=True, exist_ok=True)
+    with DuckDBMetaStoreEngine(config, read_only=False, embedding_model='model-a').open(
+        bootstrap=True
+    ):
+        pass
+
+    # NB: an engine without an explicit model keeps the recorded one when exporting
+    with DuckDBMetaStoreEngine(config, read_only=False).open(bootstrap=True) as engine:
+        assert engine.stored_embedding_model('roles') == 'model-a'
+
+    with DuckDBMetaStoreEngine(config).open(bootstrap=True) as engine:
+        assert engine.stored_embedding_model('roles') == 'model-a'
+        assert engine.stored_embedding_model('skills') == 'model-a'
+
+
+def test_embedding_model_missing_index(engine: DuckDBMetaStoreEngine) -> None:
+    with engine.open(bootstrap=True):
+        assert engine.stored_embedding_model('roles') is None
@@ -1,4 +1,5 @@
 import duckdb
+import numpy as np
 import pytest
 import pyarrow as pa
 from typing import Generator
@@ -49,6 +50,50 @@ def test_upsert_and_get_one(session: CursorLikeMetaStoreSession) -> None:
     assert result.column('description')[0].as_py() == 'A test role'
 
 
+def test_upsert_replaces_existing(session: CursorLikeMetaStoreSession) -> None:
+    record = {
+        'name': 'test-role',
+        'date_created': '2023-01-01T00:00:00+00:00',
+        'description': 'A test role',
+        'tags': [],
+        'uuid': '123',
+        'etag': None,
+        'files': ['ROLE.md'],
+        'embedding': None,
+    }
+    session.upsert('roles', [record])
+    session.upsert(
+        'roles', [{**record, 'description': 'first'}, {**record, 'description': 'second'}]
+    )
+
+    result = session.get_many('roles')
+    assert result.num_rows == 1
+    assert result.column('description')[0].as_py() == 'second'
+
+
+def test_get_record(session: CursorLikeMetaStoreSession) -> None:
+    assert session.get_record('skills', 'nonexistent', ['uuid']) is None
+
+    data = [
+        {
+            'name': 'my-skill',
+            'date_created': '2023-01-01T00:00:00',
+            'description': 'desc',
+            'tags': [],
+            'uuid': '123',
+            'etag': 'abc',
+            'files': ['skills/my-skill/SKILL.md'],
+            'embedding': None,
+        }
+    ]
+    session.upsert('skills', data)
+
+    assert session.get_record('skills', 'my-skill', ['files', 'uuid']) == {
+        'files': ['skills/my-skill/SKILL.md'],
+        'uuid': '123',
+    }
+
+
 def test_exists(session: CursorLikeMetaStoreSession) -> None:
     assert not session.exists('roles', 'nonexistent')
 
@@ -123,6 +168,11 @@ def test_get_many(session: CursorLikeMetaStoreSession) -> None:
     assert len(some_roles) == 1
     assert some_roles.column('name')[0].as_py() == 'role1'
 
+    # Stream all
+    batches = list(session.get_many_batches('roles', column_filter=['name'], batch_size=1))
+    assert sum(batch.num_rows for batch in batches) == 2
+    assert batches[0].schema.names == ['name']
+
 
 def test_truncate_tables(session: CursorLikeMetaStoreSession) -> None:
     data = [
@@ -184,3 +234,7 @@ def test_search(session: CursorLikeMetaStoreSession) -> None:
     assert len(results) == 1
     assert results.column('name')[0].as_py() == 'match'
     assert 'score' in results.column_names
+
+    # Query vectors can also be passed as a float32 array without a list round-trip
+    results = session.search(np.full(384, 0.9, dtype=np.float32), 'roles', limit=1)
+    assert results.column('name')[0].as_py() == 'match'
@@ -1,9 +1,10 @@
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from persona.config import LocalFileStoreConfig
-from persona.storage.filestore import LocalFileStore
+from persona.storage.filestore import BaseFileStore, LocalFileStore
 from persona.storage.transaction import Transaction
 
 
@@ -23,6 +24,23 @@ def test_join_path(local_store: LocalFileStore) -> None:
     assert local_store.join_path(key) == expected
 
 
+def test_join_path_already_joined(local_store: LocalFileStore) -> None:
+    joined = local_store.join_path('foo/bar.txt')
+    assert local_store.join_path(joined) == joined
+
+
+def test_delete_globbed_paths_with_transaction(local_store: LocalFileStore) -> None:
+    local_store.save('tpl/a.txt', b'a')
+
+    with Transaction(local_store, MagicMock()) as transaction:
+        for path in local_store.glob('tpl/*'):
+            local_store.delete(path)
+        assert not local_store.exists('tpl/a.txt')
+        transaction.rollback()
+
+    assert local_store.load('tpl/a.txt') == b'a'
+
+
 def test_join_path_no_root() -> None:
     config = LocalFileStoreConfig(root='')
     store = LocalFileStore(config)
@@ -37,6 +55,25 @@ def test_save_load(local_store: LocalFileStore) -> None:
     assert local_store.load(key) == data
 
 
+def test_load_many(local_store: LocalFileStore) -> None:
+    local_store.save('many/a.txt', b'a')
+    local_store.save('many/b.txt', b'b')
+    assert local_store.load_many(['many/a.txt', 'many/b.txt']) == {
+        'many/a.txt': b'a',
+        'many/b.txt': b'b',
+    }
+
+
+def test_save_many_delete_many(local_store: LocalFileStore) -> None:
+    local_store._save_many({'a.txt': b'a', 'nested/dir/b.txt': b'b'})
+    assert local_store.load('a.txt') == b'a'
+    assert local_store.load('nested/dir/b.txt') == b'b'
+
+    local_store._delete_many(['a.txt', 'nested/dir/b.txt', 'missing.txt'])
+    assert not local_store.exists('a.txt')
+    assert not local_store.exists('nested/dir/b.txt')
+
+
 def test_exists(local_store: LocalFileStore) -> None:
     key = 'exists.txt'
     local_store.save(key, b'')
@@ -52,6 +89,14 @@ def test_delete(local_store: LocalFileStore) -> None:
     assert not local_store.exists(key)
 
 
+def test_stat(local_store: LocalFileStore) -> None:
+    local_store.save('dir/file.txt', b'')
+    assert local_store._stat('dir/file.txt') == (True, False)
+    assert local_store._stat('dir') == (True, True)
+    assert local_store._stat('missing.txt') == (False, False)
+    assert BaseFileStore._stat(local_store, 'dir') == (True, True)
+
+
 def test_delete_recursive(local_store: LocalFileStore) -> None:
     local_store.save('dir/file1.txt', b'1')
     local_store.save('dir/file2.txt', b'2')
@@ -60,6 +105,18 @@ def test_delete_recursive(local_store: LocalFileStore) -> None:
     assert not local_store.exists('dir')
 
 
+def test_save_after_directory_removed(local_store: LocalFileStore) -> None:
+    local_store.save('dir/a.txt', b'a')
+    local_store.delete('dir', recursive=True)
+    local_store.save('dir/b.txt', b'b')
+    assert local_store.load('dir/b.txt') == b'b'
+
+    # Removed outside of the store, so the cached directory is stale
+    shutil.rmtree(Path(local_store.join_path('dir')))
+    local_store.save('dir/c.txt', b'c')
+    assert local_store.load('dir/c.txt') == b'c'
+
+
 def test_glob(local_store: LocalFileStore) -> None:
     local_store.save('glob/a.txt', b'')
     local_store.save('glob/b.txt', b'')
@@ -69,8 +126,16 @@ def test_glob(local_store: LocalFileStore) -> None:
     assert any('b.txt' in r for r in results)
 
 
+def test_glob_matches_fsspec(local_store: LocalFileStore) -> None:
+    for key in ['glob/a.txt', 'glob/.hidden.txt', 'glob/c.md', 'glob/sub/d.txt']:
+        local_store.save(key, b'')
+    for pattern in ['glob/*.txt', 'glob/*', 'glob/**/*', '*/a.txt', 'missing/*']:
+        assert local_store.glob(pattern) == local_store._fs.glob(local_store.join_path(pattern))
+
+
 def test_save_with_transaction_new_file(local_store: LocalFileStore) -> None:
     mock_transaction = MagicMock(spec=Transaction)
+    mock_transaction._has_log_entry.return_value = False
     local_store._transaction = mock_transaction
 
     key = 'new.txt'
@@ -88,6 +153,7 @@ def test_save_with_transaction_existing_file(local_store: LocalFileStore) -> Non
     local_store.save(key, original_data)
 
     mock_transaction = MagicMock(spec=Transaction)
+    mock_transaction._has_log_entry.return_value = False
     local_store._transaction = mock_transaction
 
     new_data = b'new'
@@ -98,12 +164,28 @@ def test_save_with_transaction_existing_file(local_store: LocalFileStore) -> Non
     mock_transaction._add_file_hash.assert_called_with(key, new_data)
 
 
+def test_save_twice_with_transaction(local_store: LocalFileStore) -> None:
+    key = 'twice.txt'
+    local_store.save(key, b'original')
+
+    with Transaction(local_store, MagicMock()) as transaction:
+        local_store.save(key, b'first')
+        local_store.save(key, b'second')
+
+        # Only the state before the transaction is kept for rollback
+        assert transaction._log == [('restore', key, b'original')]
+        transaction.rollback()
+
+    assert local_store.load(key) == b'original'
+
+
 def test_delete_with_transaction(local_store: LocalFileStore) -> None:
     key = 'del_trans.txt'
     data = b'data'
     local_store.save(key, data)
 
     mock_transaction = MagicMock(spec=Transaction)
+    mock_transaction._has_log_entry.return_value = False
     local_store._transaction = mock_transaction
 
     local_store.delete(key)
@@ -118,10 +200,11 @@ def test_delete_dir_with_transaction_ignored(local_store: LocalFileStore) -> Non
     local_store.save('dir/file.txt', b'')
 
     mock_transaction = MagicMock(spec=Transaction)
+    mock_transaction._has_log_entry.return_value = False
     local_store._transaction = mock_transaction
 
     # Attempt to delete directory (should rely on underlying fs, no transaction logging logic for dirs in _delete wrapper?)
-    # The code says: if not self._fs.isdir(self.join_path(key)): ... log ...
+    # The code says: if info['type'] != 'directory': ... log ...
     local_store.delete('dir', recursive=True)
 
     mock_transaction._add_log_entry.assert_not_called()
@@ -24,14 +24,14 @@ class TestTemplateHashValues:
     def test_hash_content(self) -> None:
         thv = TemplateHashValues()
         content = b'hello world'
-        # md5 of 'hello world' is 5eb63bbbe01eeed093cb22bb8f5acdc3
-        assert thv._hash_content(content) == '5eb63bbbe01eeed093cb22bb8f5acdc3'
+        # blake2b (16 byte digest) of 'hello world' is e9a804b2e527fd3601d2ffc0bb023cd6
+        assert thv._hash_content(content) == 'e9a804b2e527fd3601d2ffc0bb023cd6'
 
     def test_add(self) -> None:
         thv = TemplateHashValues()
         thv.add('file.txt', b'hello world')
         assert 'file.txt' in thv.root
-        assert thv.root['file.txt'] == '5eb63bbbe01eeed093cb22bb8f5acdc3'
+        assert thv.root['file.txt'] == 'e9a804b2e527fd3601d2ffc0bb023cd6'
 
     def test_hash(self) -> None:
         thv = TemplateHashValues()
@@ -42,7 +42,7 @@ class TestTemplateHashValues:
         # {"file1.txt": "...", "file2.txt": "..."}
         h = thv.hash()
         assert isinstance(h, str)
-        assert len(h) == 32  # MD5 hex digest length
+        assert len(h) == 32  # 16 byte BLAKE2b hex digest length
 
     def test_hash_with_exclude(self) -> None:
         thv = TemplateHashValues()
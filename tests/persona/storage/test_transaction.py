@@ -66,8 +66,8 @@ def test_context_manager_empty_transaction_bug(
 
 def test_transaction_id(transaction: Transaction) -> None:
     # Initially empty hash
-    # md5("{}") = 99914b932bd37a50b983c5e7c90ae93b
-    assert transaction.transaction_id == '99914b932bd37a50b983c5e7c90ae93b'
+    # blake2b("{}", digest_size=16) = 2afb9b83f9314e5d029766197f539792
+    assert transaction.transaction_id == '2afb9b83f9314e5d029766197f539792'
 
     transaction._add_file_hash('file1', b'content1')
     tid1 = transaction.transaction_id
@@ -93,17 +93,35 @@ def test_rollback_explicit(transaction: Transaction, mock_file_store: MagicMock)
 
     transaction.rollback()
 
-    # Check calls in reverse order
-    # 1. delete file2
-    # 2. restore file1
+    # Rollback groups the log into one bulk delete and one bulk restore
+    # ('delete', 'file2.txt', None) -> _file_store._delete_many(['file2.txt'])
+    # ('restore', 'file1.txt', b'old_data') -> _file_store._save_many({'file1.txt': b'old_data'})
 
-    # We can check specific calls.
-    # Note: rollback iterates reversed.
-    # ('delete', 'file2.txt', None) -> _file_store._delete('file2.txt', recursive=False)
-    # ('restore', 'file1.txt', b'old_data') -> _file_store._save('file1.txt', b'old_data')
+    mock_file_store._delete_many.assert_called_once_with(['file2.txt'])
+    mock_file_store._save_many.assert_called_once_with({'file1.txt': b'old_data'})
 
-    mock_file_store._delete.assert_called_with('file2.txt', recursive=False)
-    mock_file_store._save.assert_called_with('file1.txt', b'old_data')
+
+def test_add_log_entry_keeps_first_entry_per_key(transaction: Transaction) -> None:
+    transaction._add_log_entry('delete', 'key1')
+    transaction._add_log_entry('restore', 'key1', b'data')
+
+    assert transaction._has_log_entry('key1')
+    assert transaction._log == [('delete', 'key1', None)]
+
+
+def test_rollback_keeps_earliest_entry(
+    transaction: Transaction, mock_file_store: MagicMock
+) -> None:
+    # file1 existed and was written twice, file2 was created and then overwritten
+    transaction._add_log_entry('restore', 'file1.txt', b'original')
+    transaction._add_log_entry('restore', 'file1.txt', b'intermediate')
+    transaction._add_log_entry('delete', 'file2.txt')
+    transaction._add_log_entry('restore', 'file2.txt', b'created')
+
+    transaction.rollback()
+
+    mock_file_store._save_many.assert_called_once_with({'file1.txt': b'original'})
+    mock_file_store._delete_many.assert_called_once_with(['file2.txt'])
 
 
 def test_process_metadata_upsert(
@@ -181,6 +199,9 @@ def test_commit_success(
     # Check index update
     mock_session.upsert.assert_called()
 
+    # Staged metadata must not leak into the next transaction on the same engine
+    assert mock_meta_store_engine._metadata == []
+
 
 def test_commit_failure_exception_in_block(
     transaction: Transaction, mock_file_store: MagicMock
@@ -192,7 +213,7 @@ def test_commit_failure_exception_in_block(
             raise RuntimeError('Failure')
 
     # Check rollback happened
-    mock_file_store._save.assert_called_with('file.txt', b'old')
+    mock_file_store._save_many.assert_called_once_with({'file.txt': b'old'})
 
 
 def test_commit_failure_metadata_exception(
@@ -210,4 +231,4 @@ def test_commit_failure_metadata_exception(
             pass
 
     # Check rollback happened
-    mock_file_store._save.assert_called_with('file.txt', b'old')
+    mock_file_store._save_many.assert_called_once_with({'file.txt': b'old'})
@@ -4,7 +4,7 @@ import pytest
 import frontmatter
 import numpy as np
 
-from persona.api import PersonaAPI
+from persona.api import PersonaAPI, _inject_skill_version
 from persona.storage import BaseFileStore, CursorLikeMetaStoreEngine
 from persona.embedder import FastEmbedder
 from persona.models import SkillFile
@@ -41,6 +41,7 @@ def mock_embedder() -> MagicMock:
     embedder = MagicMock(spec=FastEmbedder)
     # Mock encode to return a generic vector
     embedder.encode.return_value = np.array([[0.1, 0.2, 0.3]], dtype=np.float32)
+    embedder.encode_query.return_value = np.array([0.1, 0.2, 0.3], dtype=np.float32)
     return embedder
 
 
@@ -117,13 +118,31 @@ class TestListingAndSearch:
 
         # Assert
         assert results == expected_results
-        mock_embedder.encode.assert_called_once_with(['test query'])
+        mock_embedder.encode_query.assert_called_once_with('test query')
         mock_session.search.assert_called_once()
         # Verify default limits from config were used
         call_kwargs = mock_session.search.call_args.kwargs
         assert call_kwargs['limit'] == 5
         assert call_kwargs['max_cosine_distance'] == 0.5
 
+    def test_search_templates_explicit_zero_threshold(
+        self, api: PersonaAPI, mock_meta_store: MagicMock
+    ) -> None:
+        # Arrange
+        mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
+        mock_session.search.return_value.to_pylist.return_value = []
+
+        # Act
+        api.search_templates(
+            query='test query', type='roles', columns=['name'], limit=1, max_cosine_distance=0.0
+        )
+
+        # Assert
+        # A falsy but explicit threshold must not fall back to the config default
+        call_kwargs = mock_session.search.call_args.kwargs
+        assert call_kwargs['limit'] == 1
+        assert call_kwargs['max_cosine_distance'] == 0.0
+
 
 class TestContentRetrieval:
     def test_get_definition_success(
@@ -184,27 +203,69 @@ class TestContentRetrieval:
     ) -> None:
         # Arrange
         mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
-        mock_session.exists.return_value = True
-        mock_session.get_one.return_value.to_pylist.return_value = [
-            {'files': ['skills/my_skill/s.py']}
-        ]
-        mock_file_store.load.return_value = b'code'
+        mock_session.get_record.return_value = {'files': ['skills/my_skill/s.py']}
+        mock_file_store.load_many.return_value = {'skills/my_skill/s.py': b'code'}
 
         # Act
         files = api.get_skill_files('my_skill')
 
         # Assert
         assert files == {'s.py': b'code'}
-        mock_file_store.load.assert_called_with('skills/my_skill/s.py')
+        mock_file_store.load_many.assert_called_once_with(['skills/my_skill/s.py'])
 
     def test_get_skill_files_not_found(self, api: PersonaAPI, mock_meta_store: MagicMock) -> None:
         mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
-        mock_session.exists.return_value = False
+        mock_session.get_record.return_value = None
 
         with pytest.raises(ValueError, match="Skill 'missing' does not exist"):
             api.get_skill_files('missing')
 
 
+@pytest.mark.parametrize(
+    ('raw_content', 'expected'),
+    [
+        (
+            b'---\nname: my_skill\n---\nbody\n',
+            b"---\nname: my_skill\nmetadata:\n  version: 'v1'\n---\nbody\n",
+        ),
+        (b'---\n---\nbody\n', b"---\nmetadata:\n  version: 'v1'\n---\nbody\n"),
+        # Existing metadata key, needs a full parse
+        (b'---\nname: my_skill\nmetadata:\n  author: me\n---\nbody\n', None),
+        # No (YAML) frontmatter
+        (b'body\n', None),
+        (b'+++\nname = "my_skill"\n+++\nbody\n', None),
+    ],
+)
+def test_inject_skill_version(raw_content: bytes, expected: bytes | None) -> None:
+    assert _inject_skill_version(raw_content, 'v1') == expected
+
+
+class TestSkillFiles:
+    def test_skill_md_cached_per_version(
+        self, api: PersonaAPI, mock_meta_store: MagicMock, mock_file_store: MagicMock
+    ) -> None:
+        # Arrange
+        mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
+        mock_session.get_record.return_value = {
+            'name': 'my_skill',
+            'files': ['skills/my_skill/SKILL.md'],
+            'uuid': 'v1',
+        }
+        mock_file_store.load_many.return_value = {
+            'skills/my_skill/SKILL.md': b'---\nname: my_skill\n---\nbody\n'
+        }
+
+        # Act
+        first = api._skill_files('my_skill')
+        second = api._skill_files('my_skill')
+
+        # Assert
+        assert first['SKILL.md'].content == second['SKILL.md'].content
+        assert mock_file_store.load_many.call_args_list[0].args == (['skills/my_skill/SKILL.md'],)
+        # SKILL.md is served from the cache for the same version
+        assert mock_file_store.load_many.call_args_list[1].args == ([],)
+
+
 class TestSkillInstallation:
     def test_install_skill_validation(self, api: PersonaAPI) -> None:
         with pytest.raises(ValueError, match='must be absolute'):
@@ -225,18 +286,17 @@ class TestSkillInstallation:
         target_dir.mkdir()
 
         mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
-        mock_session.exists.return_value = True
-        mock_session.get_one.return_value.to_pylist.return_value = [
-            {'name': 'test_skill', 'files': ['skills/test_skill/script.py'], 'uuid': 'uuid-123'}
-        ]
+        mock_session.get_record.return_value = {
+            'name': 'test_skill',
+            'files': ['skills/test_skill/script.py'],
+            'uuid': 'uuid-123',
+        }
 
         # Mock file loading
-        def load_side_effect(path: str) -> bytes:
-            if path.endswith('SKILL.md'):
-                return b'---\nname: test_skill\n---\n'
-            return b"print('hello')"
-
-        mock_file_store.load.side_effect = load_side_effect
+        mock_file_store.load_many.return_value = {
+            'skills/test_skill/SKILL.md': b'---\nname: test_skill\n---\n',
+            'skills/test_skill/script.py': b"print('hello')",
+        }
 
         # Act
         # Note: SKILL.md is implicitly added in _skill_files logic
@@ -247,11 +307,45 @@ class TestSkillInstallation:
         assert (target_dir / 'test_skill' / 'script.py').exists()
         assert (target_dir / 'test_skill' / 'SKILL.md').exists()
 
+        # SKILL.md and the other files are fetched in a single batch
+        mock_file_store.load_many.assert_called_once_with(
+            ['skills/test_skill/SKILL.md', 'skills/test_skill/script.py']
+        )
+
         # Check UUID injection in SKILL.md
         with open(result_path, 'r') as f:
             content = frontmatter.load(f)
             assert content.metadata['metadata']['version'] == 'uuid-123'
 
+    def test_install_library_skill_keeps_nested_paths(
+        self, mock_config: MagicMock, mock_meta_store: MagicMock, tmp_path: plb.Path
+    ) -> None:
+        # Arrange
+        # Library skills are stored relative to the skills folder, without a 'skills/' prefix
+        lib_skills = {
+            'data_skills': {
+                'SKILL.md': SkillFile(
+                    content=b'---\nname: data_skills\n---\n',
+                    name='SKILL.md',
+                    storage_file_path='data_skills/SKILL.md',
+                    extension='.md',
+                ),
+            }
+        }
+        api = PersonaAPI(
+            config=mock_config,
+            meta_store=mock_meta_store,
+            file_store=MagicMock(),
+            library_skills=lib_skills,
+        )
+
+        # Act
+        result_path = api.install_skill('data_skills', tmp_path)
+
+        # Assert
+        assert result_path == str(tmp_path / 'data_skills' / 'SKILL.md')
+        assert (tmp_path / 'data_skills' / 'SKILL.md').exists()
+
 
 class TestPublishAndDelete:
     def test_publish_template(
@@ -310,19 +404,19 @@ class TestMetadata:
     def test_get_skill_version(self, api: PersonaAPI, mock_meta_store: MagicMock) -> None:
         # Arrange
         mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
-        mock_session.exists.return_value = True
-        mock_session.get_one.return_value.to_pylist.return_value = [{'uuid': 'v1'}]
+        mock_session.get_record.return_value = {'uuid': 'v1'}
 
         # Act
         version = api.get_skill_version('my_skill')
 
         # Assert
         assert version == 'v1'
-        mock_session.get_one.assert_called_once_with('skills', 'my_skill', ['uuid'])
+        mock_session.get_record.assert_called_once_with('skills', 'my_skill', ['uuid'])
 
     def test_get_skill_version_not_found(self, api: PersonaAPI, mock_meta_store: MagicMock) -> None:
         mock_session = mock_meta_store.read_session.return_value.__enter__.return_value
-        mock_session.exists.return_value = False
+        mock_session.get_record.return_value = None
 
         with pytest.raises(ValueError, match="Skill 'missing' not found"):
             api.get_skill_version('missing')
+        mock_session.exists.assert_not_called()
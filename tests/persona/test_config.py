@@ -10,6 +10,7 @@ from persona.config import (
     LocalFileStoreConfig,
     PersonaConfig,
     parse_persona_config,
+    read_config_file,
 )
 
 
@@ -137,3 +138,17 @@ def test_parse_persona_config_valid() -> None:
     assert config.file_store.root == '/fs'
     assert config.meta_store.root == '/ms'
     assert config.meta_store.index_folder == 'i'
+
+
+def test_read_config_file(tmp_path: plb.Path) -> None:
+    config_path = tmp_path / '.persona.config.yaml'
+    config_path.write_text('root: /tmp\nfile_store:\n  type: local\n')
+
+    assert read_config_file(config_path) == {'root': '/tmp', 'file_store': {'type': 'local'}}
+
+
+def test_read_config_file_empty(tmp_path: plb.Path) -> None:
+    config_path = tmp_path / '.persona.config.yaml'
+    config_path.write_text('')
+
+    assert read_config_file(config_path) == {}
@@ -12,6 +12,12 @@ from tokenizers import Encoding
 from persona.embedder import EmbeddingDownloader, FastEmbedder, get_embedding_model
 
 
+@pytest.fixture(autouse=True)
+def clear_cuda_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    # NB: make sure the host environment does not opt the tests into CUDA
+    monkeypatch.delenv('PERSONA_USE_CUDA', raising=False)
+
+
 @pytest.fixture
 def mock_user_data_path() -> Generator[MagicMock, None, None]:
     with patch('persona.embedder.user_data_path') as mock:
@@ -81,6 +87,24 @@ class TestGetEmbeddingModel:
             mock_tokenizer.from_file.assert_called_once()
             mock_ort.InferenceSession.assert_called_once()
 
+    def test_model_is_reused(
+        self,
+        mock_tokenizer: MagicMock,
+        mock_ort: MagicMock,
+        tmp_path: pytest.TempPathFactory,
+    ) -> None:
+        # Arrange
+        model_dir = cast(plb.Path, tmp_path)
+
+        # Act
+        with patch('persona.embedder.EmbeddingDownloader'):
+            first = get_embedding_model(model_dir)
+            second = get_embedding_model(model_dir)
+
+        # Assert
+        assert first is second
+        mock_ort.InferenceSession.assert_called_once()
+
     def test_model_missing_triggers_download(
         self,
         mock_user_data_path: MagicMock,
@@ -202,3 +226,107 @@ class TestFastEmbedder:
         assert input_feed['attention_mask'].shape == (1, 3)
 
         assert np.array_equal(result, expected_output)
+
+    def test_encode_batches_sorted_by_length(
+        self, mock_tokenizer: MagicMock, mock_ort: MagicMock
+    ) -> None:
+        # Arrange
+        embedder = FastEmbedder(model_dir='/tmp/model')
+        tokenizer_instance = mock_tokenizer.from_file.return_value
+        # NB: pad every batch to its longest text, like the real tokenizer does
+        tokenizer_instance.encode_batch.side_effect = lambda texts: [
+            MagicMock(
+                spec=Encoding,
+                ids=[len(t)] * max(map(len, texts)),
+                attention_mask=[1] * max(map(len, texts)),
+            )
+            for t in texts
+        ]
+        session_instance = mock_ort.InferenceSession.return_value
+        session_instance.run.side_effect = lambda _, inputs: [
+            inputs['input_ids'][:, :1].astype(np.float32)
+        ]
+        texts = ['x' * (i % 7 + 1) for i in range(10)]
+
+        # Act
+        result = embedder.encode(texts, batch_size=4)
+
+        # Assert
+        assert session_instance.run.call_count == 3
+        batch_widths = [c[0][1]['input_ids'].shape[1] for c in session_instance.run.call_args_list]
+        assert batch_widths == sorted(batch_widths, reverse=True)
+        assert result[:, 0].tolist() == [len(t) for t in texts]
+
+    def test_init_defaults_to_cpu(self, mock_tokenizer: MagicMock, mock_ort: MagicMock) -> None:
+        # Act
+        FastEmbedder(model_dir='/tmp/model')
+
+        # Assert
+        _, kwargs = mock_ort.InferenceSession.call_args
+        assert kwargs['providers'] == ['CPUExecutionProvider']
+        mock_ort.get_available_providers.assert_not_called()
+
+    def test_init_cuda_opt_in(
+        self, mock_tokenizer: MagicMock, mock_ort: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setenv('PERSONA_USE_CUDA', '1')
+        mock_ort.get_available_providers.return_value = [
+            'CUDAExecutionProvider',
+            'CPUExecutionProvider',
+        ]
+
+        # Act
+        FastEmbedder(model_dir='/tmp/model')
+
+        # Assert
+        _, kwargs = mock_ort.InferenceSession.call_args
+        assert kwargs['providers'] == ['CUDAExecutionProvider', 'CPUExecutionProvider']
+
+    def test_init_cuda_unavailable_falls_back_to_cpu(
+        self, mock_tokenizer: MagicMock, mock_ort: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setenv('PERSONA_USE_CUDA', '1')
+        mock_ort.get_available_providers.return_value = ['CPUExecutionProvider']
+
+        # Act
+        FastEmbedder(model_dir='/tmp/model')
+
+        # Assert
+        _, kwargs = mock_ort.InferenceSession.call_args
+        assert kwargs['providers'] == ['CPUExecutionProvider']
+
+    def test_encode_query_cached(self, mock_tokenizer: MagicMock, mock_ort: MagicMock) -> None:
+        # Arrange
+        embedder = FastEmbedder(model_dir='/tmp/model')
+        session_instance = mock_ort.InferenceSession.return_value
+        session_instance.run.return_value = [np.ones((1, 384), dtype=np.float32)]
+
+        # Act
+        first = embedder.encode_query('test query')
+        second = embedder.encode_query('test query')
+
+        # Assert
+        assert second is first
+        assert first.shape == (384,)
+        assert first.dtype == np.float32
+        assert not first.flags.writeable
+        session_instance.run.assert_called_once()
+
+    def test_model_id_tracks_model_files(
+        self, mock_tokenizer: MagicMock, mock_ort: MagicMock, tmp_path: plb.Path
+    ) -> None:
+        # Arrange
+        (tmp_path / 'model.onnx').write_bytes(b'graph')
+        (tmp_path / 'model.onnx.data').write_bytes(b'weights-v1')
+
+        # Act
+        first = FastEmbedder(model_dir=tmp_path).model_id
+        (tmp_path / 'model.onnx.data').write_bytes(b'weights-v2')
+        second = FastEmbedder(model_dir=tmp_path).model_id
+
+        # Assert
+        assert len(first) == 32
+        assert first != second
+        assert FastEmbedder(model_dir=tmp_path).model_id == second
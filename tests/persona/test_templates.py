@@ -1,6 +1,7 @@
 import pathlib as plb
 from unittest.mock import MagicMock
 
+import frontmatter
 import numpy as np
 import pytest
 from pydantic import ValidationError
@@ -13,6 +14,7 @@ from persona.templates import (
     SourceFile,
     TemplateFile,
     _is_persona_root_file,
+    parse_frontmatter,
 )
 
 
@@ -29,6 +31,24 @@ def test_is_persona_root_file(filename: str, expected: bool) -> None:
     assert _is_persona_root_file(plb.Path(filename)) == expected
 
 
+def test_parse_frontmatter_cached() -> None:
+    # Arrange
+    content = b'---\nname: test\ndescription: A test role\n---\nYou are a test role.\n'
+
+    # Act
+    metadata, body, handler = parse_frontmatter(content)
+    metadata_again, _, _ = parse_frontmatter(content)
+
+    # Assert
+    assert metadata['name'] == 'test'
+    assert metadata['description'] == 'A test role'
+    assert body == 'You are a test role.'
+    assert isinstance(handler, frontmatter.YAMLHandler)
+    assert metadata_again is metadata
+    with pytest.raises(TypeError):
+        metadata['name'] = 'changed'  # type: ignore[index]
+
+
 def test_source_file_properties(tmp_path: plb.Path) -> None:
     # Arrange
     content = b'test content'
@@ -225,6 +245,50 @@ def test_process_template_overrides(tmp_path: plb.Path) -> None:
     mock_tagger.extract_tags.assert_not_called()
 
 
+def test_process_template_reuses_stored_embedding(tmp_path: plb.Path) -> None:
+    # Arrange
+    root_file = tmp_path / 'SKILL.md'
+    root_file.write_text('---\nname: fm-name\ndescription: fm-desc\ntags: [fm-tag]\n---')
+    skill = Skill(path=root_file)
+
+    entry = IndexEntry()
+    mock_meta_engine = MagicMock()
+    mock_meta_engine.stored_embedding_model.return_value = 'model-a'
+    session = mock_meta_engine.read_session.return_value.__enter__.return_value
+    session.get_record.return_value = {
+        'description': 'fm-name - fm-desc',
+        'embedding': (0.5,) * 384,
+    }
+    mock_embedder = MagicMock()
+    mock_embedder.model_id = 'model-a'
+
+    # Act
+    skill.process_template(
+        entry=entry,
+        target_file_store=MagicMock(),
+        meta_store_engine=mock_meta_engine,
+        embedder=mock_embedder,
+        tagger=MagicMock(),
+    )
+
+    # Assert
+    assert entry.embedding == [0.5] * 384
+    mock_embedder.encode.assert_not_called()
+    session.get_record.assert_called_once_with('skills', 'fm-name', ['description', 'embedding'])
+
+    # A different model invalidates the stored embedding
+    mock_embedder.model_id = 'model-b'
+    mock_embedder.encode.return_value = np.zeros((1, 384))
+    skill.process_template(
+        entry=IndexEntry(),
+        target_file_store=MagicMock(),
+        meta_store_engine=mock_meta_engine,
+        embedder=mock_embedder,
+        tagger=MagicMock(),
+    )
+    mock_embedder.encode.assert_called_once()
+
+
 def test_process_template_missing_metadata_error(tmp_path: plb.Path) -> None:
     # Arrange
     root_file = tmp_path / 'SKILL.md'